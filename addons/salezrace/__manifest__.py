@@ -7,7 +7,7 @@
     "description": "Register racers, start them, and log/assign finish times.",
     "author": "Your Company",
     "license": "LGPL-3",
-    "depends": ["base", "web", "mail"],
+    "depends": ["base", "web", "mail", "bus"],
     "data": [
         "security/salezrace_security.xml",
         "security/ir.model.access.csv",
@@ -16,14 +16,21 @@
         "report/paperformat.xml",
         "report/report_actions.xml",
         "report/salezrace_dashboard_report.xml",
+        "report/salezrace_results_report.xml",
         "views/racer_views.xml",
         "views/racer_time_wizard_views.xml",
+        "views/racer_import_wizard_views.xml",
         "views/pause_log_views.xml",
+        "views/timing_event_views.xml",
+        "views/finish_log_views.xml",
+        "views/result_views.xml",
         "views/menu_and_actions.xml",
         "views/hide_apps.xml",
     ],
     "assets": {
         "web.assets_backend": [
+            "salezrace/static/src/js/race_bus.js",
+            "salezrace/static/src/js/offline_queue.js",
             "salezrace/static/src/js/start_client_action.js",
             "salezrace/static/src/xml/start_client_action.xml",
             "salezrace/static/src/js/finish_client_action.js",
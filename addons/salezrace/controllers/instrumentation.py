@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from odoo import http, _
+from odoo.exceptions import AccessError
+from odoo.http import request
+
+from ..models.instrumentation import get_call_log, summarize_calls
+
+
+# Latest calls returned when ``limit`` is missing or not a number.
+DEFAULT_CALL_LIMIT = 200
+
+
+class SalezRaceInstrumentation(http.Controller):
+
+    @http.route("/salezrace/call_stats", type="http", auth="user", methods=["GET"])
+    def call_stats(self, limit=None):
+        """Recorded RPC calls of the serving worker: per-method summary and the latest calls.
+
+        Enable recording with the ``salezrace.instrumentation`` system parameter.
+        """
+        if not request.env.user.has_group("salezrace.group_salezrace_manager"):
+            raise AccessError(_("Only race managers can see call statistics."))
+        try:
+            limit = max(0, int(limit))
+        except (TypeError, ValueError):
+            limit = DEFAULT_CALL_LIMIT
+        calls = get_call_log(request.env.cr.dbname)
+        return request.make_json_response({
+            "summary": summarize_calls(calls),
+            "calls": calls[::-1][:limit],
+        })
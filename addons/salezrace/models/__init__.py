@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
+from . import instrumentation
 from . import racer
 from . import finish_log
 from . import res_users
 from . import pause_log
 from . import checkpoint
+from . import timing_event
+from . import result
+from . import ir_websocket
@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError
 
+from .instrumentation import instrumented
+
 
 GENDER_SELECTION = [("male", "Male"), ("female", "Female")]
 
@@ -18,6 +20,7 @@ class SalezRaceFinishLog(models.Model):
     """
 
     _name = "salezrace.finish.log"
+    _inherit = ["salezrace.instrumented.mixin"]
     _description = "SalezRace Finish Log"
     _order = "time desc, id desc"
 
@@ -33,12 +36,13 @@ class SalezRaceFinishLog(models.Model):
         readonly=False,
     )
 
-    # Helper (transient) fields for display in the Finish table
-    first_name: fields.Char = fields.Char(compute="_compute_helper_fields")
-    last_name: fields.Char = fields.Char(compute="_compute_helper_fields")
-    age: fields.Integer = fields.Integer(compute="_compute_helper_fields")
+    # Helper (transient) fields for display in the Finish table; related
+    # fields read all racers of the prefetch set at once.
+    first_name: fields.Char = fields.Char(related="racer_id.first_name")
+    last_name: fields.Char = fields.Char(related="racer_id.last_name")
+    age: fields.Integer = fields.Integer(related="racer_id.age")
     gender: fields.Selection = fields.Selection(
-        selection=GENDER_SELECTION, compute="_compute_helper_fields"
+        selection=GENDER_SELECTION, related="racer_id.gender"
     )
 
     assigned: fields.Boolean = fields.Boolean(default=False)
@@ -46,30 +50,23 @@ class SalezRaceFinishLog(models.Model):
 
     @api.depends("racer_no_input")
     def _compute_racer_id(self) -> None:
-        """Resolve racer_id from racer_no_input and store it."""
-        Racer = self.env["salezrace.racer"]
+        """Resolve racer_id from racer_no_input and store it.
+
+        All distinct numbers of the recordset are resolved with one search.
+        """
+        numbers = {no for no in self.mapped("racer_no_input") if no}
+        racers = self.env["salezrace.racer"].search([("racer_no", "in", list(numbers))]) if numbers else []
+        by_no = {racer.racer_no: racer for racer in racers}
         for rec in self:
-            rec.racer_id = False
-            if rec.racer_no_input:
-                rec.racer_id = Racer.search(
-                    [("racer_no", "=", rec.racer_no_input)], limit=1
-                )
+            rec.racer_id = by_no.get(rec.racer_no_input, False)
 
     def _inverse_racer_id(self) -> None:
         """Keep racer_no_input in sync when racer_id is set."""
         for rec in self:
             rec.racer_no_input = rec.racer_id.racer_no if rec.racer_id else False
 
-    @api.depends("racer_id", "racer_id.first_name", "racer_id.last_name", "racer_id.age", "racer_id.gender")
-    def _compute_helper_fields(self) -> None:
-        """Compute helper display fields from racer_id."""
-        for rec in self:
-            rec.first_name = rec.racer_id.first_name or False
-            rec.last_name = rec.racer_id.last_name or False
-            rec.age = rec.racer_id.age if rec.racer_id else False
-            rec.gender = rec.racer_id.gender or False
-
     @api.model
+    @instrumented
     def action_log_now(self) -> int:
         """Create a new log row with the current server time.
 
@@ -78,6 +75,7 @@ class SalezRaceFinishLog(models.Model):
         rec = self.create({"time": fields.Datetime.now()})
         return rec.id
 
+    @instrumented
     def action_assign(self) -> None:
         """Assign the log's time to the related racer's finish_time.
 
@@ -96,7 +94,84 @@ class SalezRaceFinishLog(models.Model):
         if racer.finish_time:
             raise UserError(_("This racer already has a finish time."))
 
-        # Write finish_time to racer and mark this log row as assigned.
-        now = fields.Datetime.now()
-        racer.write({"finish_time": self.time})
-        self.write({"assigned": True, "assigned_time": now})
+        # Journal the finish; materializing it writes finish_time to the racer
+        # and marks this log row as assigned.
+        racer._record_timing_event("finish", event_time=self.time, finish_log_id=self.id)
+
+    @api.model
+    @instrumented
+    def action_assign_bulk(self, pairs: Sequence[Tuple[int, int]]) -> List[dict]:
+        """Assign many logged times to racers in one go.
+
+        All racer numbers are resolved with a single search and every finish is
+        journaled in this one transaction. Conflicting rows are reported and do
+        not block the others.
+
+        :param pairs: ``(log_id, racer_no)`` pairs.
+        :return: one result per pair, in input order:
+            ``{"log_id", "racer_no", "racer_id", "status", "message"}`` where
+            status is one of ``assigned``, ``unknown_log``, ``already_assigned``,
+            ``unknown_number``, ``already_finished`` or ``duplicate``.
+        """
+        pairs = [(int(log_id or 0), int(racer_no or 0)) for log_id, racer_no in pairs or []]
+        logs = self.browse(list({log_id for log_id, _no in pairs if log_id})).exists()
+        racers = self.env["salezrace.racer"].search(
+            [("racer_no", "in", [no for _log_id, no in pairs if no > 0])]
+        )
+        by_no = {racer.racer_no: racer for racer in racers}
+
+        results = []
+        events = []
+        seen_logs = set()
+        seen_nos = set()
+        for log_id, no in pairs:
+            log = self.browse(log_id) if log_id in logs.ids else None
+            racer = by_no.get(no)
+            result = {"log_id": log_id, "racer_no": no, "racer_id": racer.id if racer else False}
+            if not log:
+                result.update(status="unknown_log", message=_("Finish log %s not found.") % log_id)
+            elif log_id in seen_logs or no in seen_nos:
+                result.update(status="duplicate", message=_("Log %(log)s or racer %(no)s is listed more than once.", log=log_id, no=no))
+            elif log.assigned:
+                result.update(status="already_assigned", message=_("This log row is already assigned."))
+            elif not racer:
+                result.update(status="unknown_number", message=_("Racer %s not found.") % no)
+            elif racer.finish_time:
+                result.update(status="already_finished", message=_("This racer already has a finish time."))
+            else:
+                result.update(status="assigned", message="")
+                log.racer_no_input = no
+                events.append({
+                    "event_type": "finish",
+                    "racer_id": racer.id,
+                    "event_time": log.time,
+                    "finish_log_id": log.id,
+                })
+                seen_logs.add(log_id)
+                seen_nos.add(no)
+            results.append(result)
+
+        if events:
+            # One batch of consecutive finish events materializes together.
+            self.env["salezrace.timing.event"].create(events)._materialize()
+        return results
+
+    @instrumented
+    def action_assign_selected(self):
+        """Assign the selected rows to their typed racer numbers (list action)."""
+        results = self.action_assign_bulk([(log.id, log.racer_no_input) for log in self])
+        failed = [result for result in results if result["status"] != "assigned"]
+        message = _("%(assigned)s assigned, %(failed)s skipped.", assigned=len(results) - len(failed), failed=len(failed))
+        if failed:
+            message += "\n" + "\n".join(result["message"] for result in failed)
+        return {
+            "type": "ir.actions.client",
+            "tag": "display_notification",
+            "params": {
+                "title": _("Assign Finish Times"),
+                "message": message,
+                "type": "warning" if failed else "success",
+                "sticky": bool(failed),
+                "next": {"type": "ir.actions.client", "tag": "soft_reload"},
+            },
+        }
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Dict, List
+
+from odoo import api, models
+from odoo.tools import str2bool
+
+
+# System parameter switching the instrumentation on ("True"); off by default.
+INSTRUMENTATION_PARAM = "salezrace.instrumentation"
+# Calls kept per database, per worker process.
+CALL_LOG_SIZE = 1000
+
+_call_log: Dict[str, deque] = {}
+_local = threading.local()
+
+
+def _result_rows(result) -> int:
+    """Rough row count of an RPC result (list, recordset or dict of lists)."""
+    if isinstance(result, (list, tuple, models.BaseModel)):
+        return len(result)
+    if isinstance(result, dict):
+        return sum(len(value) for value in result.values() if isinstance(value, list))
+    return 0
+
+
+def instrumented(method):
+    """Record query count, SQL/Python time and rows of each call to ``method``.
+
+    Only the outermost instrumented call of a request is recorded, and only
+    while the ``salezrace.instrumentation`` system parameter is set.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if getattr(_local, "active", False) or not str2bool(
+            self.env["ir.config_parameter"].sudo().get_param(INSTRUMENTATION_PARAM, "False")
+        ):
+            return method(self, *args, **kwargs)
+
+        cr = self.env.cr
+        thread = threading.current_thread()
+        queries_before = cr.sql_log_count
+        # query_time is kept on HTTP worker threads only
+        sql_time_before = getattr(thread, "query_time", None)
+        started = time.perf_counter()
+        result = None
+        failed = True
+        _local.active = True
+        try:
+            result = method(self, *args, **kwargs)
+            failed = False
+        finally:
+            _local.active = False
+            total = time.perf_counter() - started
+            sql_time = getattr(thread, "query_time", None)
+            sql_time = sql_time - sql_time_before if sql_time_before is not None and sql_time is not None else None
+            _call_log.setdefault(cr.dbname, deque(maxlen=CALL_LOG_SIZE)).append({
+                "time": time.time(),
+                "model": self._name,
+                "method": method.__name__,
+                "uid": self.env.uid,
+                "records": len(self),
+                "queries": cr.sql_log_count - queries_before,
+                "sql_ms": round(sql_time * 1000, 2) if sql_time is not None else None,
+                "python_ms": round((total - (sql_time or 0)) * 1000, 2),
+                "rows": _result_rows(result),
+                "error": failed,
+            })
+        return result
+
+    return wrapper
+
+
+def get_call_log(dbname: str) -> List[dict]:
+    """Recorded calls of this worker for ``dbname``, oldest first."""
+    return list(_call_log.get(dbname, ()))
+
+
+def summarize_calls(calls: List[dict]) -> List[dict]:
+    """Per (model, method) aggregates, most queries per call first."""
+    groups = defaultdict(list)
+    for call in calls:
+        groups[(call["model"], call["method"])].append(call)
+    summary = []
+    for (model, method), group in groups.items():
+        durations = sorted((call["sql_ms"] or 0) + call["python_ms"] for call in group)
+        summary.append({
+            "model": model,
+            "method": method,
+            "calls": len(group),
+            "avg_queries": round(sum(call["queries"] for call in group) / len(group), 1),
+            "max_queries": max(call["queries"] for call in group),
+            "avg_rows": round(sum(call["rows"] for call in group) / len(group), 1),
+            "p95_ms": durations[max(0, -(-len(durations) * 95 // 100) - 1)],
+            "errors": sum(call["error"] for call in group),
+        })
+    return sorted(summary, key=lambda row: row["avg_queries"], reverse=True)
+
+
+class SalezRaceInstrumentedMixin(models.AbstractModel):
+    """Instruments ``search_read`` of the timing models (see ``instrumented``)."""
+
+    _name = "salezrace.instrumented.mixin"
+    _description = "SalezRace Instrumented Mixin"
+
+    @api.model
+    @instrumented
+    def search_read(self, domain=None, fields=None, offset=0, limit=None, order=None, **read_kwargs):
+        return super().search_read(domain, fields, offset=offset, limit=limit, order=order, **read_kwargs)
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from odoo import models
+
+from .racer import RACE_BUS_CHANNEL
+
+# Groups whose screens listen to race events (the manager implies both).
+RACE_BUS_GROUPS = ("salezrace.group_salezrace_start_finish", "salezrace.group_salezrace_pause")
+
+
+class IrWebsocket(models.AbstractModel):
+    _inherit = "ir.websocket"
+
+    def _build_bus_channel_list(self, channels):
+        """Subscribe timing staff to the race channel, and nobody else.
+
+        Race events carry racer names and ages, so the channel is added here
+        for authorized users and dropped if any other client asks for it.
+        """
+        channels = [channel for channel in channels if channel != RACE_BUS_CHANNEL]
+        user = self.env.user
+        if not user._is_public() and any(user.has_group(group) for group in RACE_BUS_GROUPS):
+            channels.append(RACE_BUS_CHANNEL)
+        return super()._build_bus_channel_list(channels)
@@ -1,12 +1,22 @@
 # -*- coding: utf-8 -*-
+import logging
+import time
+
 from odoo import fields, models, api
+from odoo.tools.sql import create_index
 from datetime import timedelta
 
+_logger = logging.getLogger(__name__)
+
+# Open pauses older than this are reverted by the cron.
+STALE_PAUSE_AGE = timedelta(minutes=1)
+
 class SalezRacePauseLog(models.Model):
     _name = "salezrace.pause.log"
+    _inherit = ["salezrace.instrumented.mixin"]
     _description = "SalezRace Pause Log"
 
-    racer_id = fields.Many2one("salezrace.racer", required=True, ondelete="cascade")
+    racer_id = fields.Many2one("salezrace.racer", required=True, ondelete="cascade", index=True)
     checkpoint_id = fields.Many2one("salezrace.checkpoint", required=True, ondelete="cascade")
     start_time = fields.Datetime()
     end_time = fields.Datetime()
@@ -16,6 +26,48 @@ class SalezRacePauseLog(models.Model):
 
     duration = fields.Float(string="Duration (s)", compute="_compute_duration", store=True)
 
+    def init(self):
+        # Open pauses are few; the cron and the active-pause lookups only scan them.
+        create_index(
+            self.env.cr,
+            "salezrace_pause_log_open_idx",
+            self._table,
+            ["start_time", "racer_id"],
+            where="end_time IS NULL",
+        )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        logs = super().create(vals_list)
+        self.env["salezrace.racer"]._bump_race_version()
+        custom = logs.filtered("is_custom")
+        (logs - custom)._notify_pause_event("pause_started")
+        custom._notify_pause_event("custom_time")
+        return logs
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env["salezrace.racer"]._bump_race_version()
+        if vals.get("is_invalid"):
+            self._notify_pause_event("pause_invalidated")
+        elif vals.get("end_time"):
+            self._notify_pause_event("pause_ended")
+        else:
+            self._notify_pause_event("pause_changed")
+        return res
+
+    def unlink(self):
+        self.env["salezrace.racer"]._bump_race_version()
+        racers = self.racer_id
+        checkpoint_ids = self.checkpoint_id.ids
+        res = super().unlink()
+        racers.exists()._notify_race_event("pause_reverted", checkpoint_ids=checkpoint_ids)
+        return res
+
+    def _notify_pause_event(self, event):
+        """Publish a race event for the racers of these logs."""
+        self.racer_id._notify_race_event(event, checkpoint_ids=self.checkpoint_id.ids)
+
     @api.depends("start_time", "end_time")
     def _compute_duration(self):
         for log in self:
@@ -27,9 +79,49 @@ class SalezRacePauseLog(models.Model):
 
     @api.model
     def _cron_revert_old_pauses(self):
-        one_minute_ago = fields.Datetime.now() - timedelta(minutes=1)
-        old_pauses = self.search([
-            ("start_time", "<=", one_minute_ago),
-            ("end_time", "=", False),
-        ])
-        old_pauses.unlink()
+        """Delete open pauses older than STALE_PAUSE_AGE in one statement.
+
+        Each deleted pause is journaled as a ``pause_revert`` timing event in
+        the same statement, so a rebuild replays the revert. Only the racers
+        owning the deleted rows are recomputed and notified.
+        """
+        started = time.perf_counter()
+        self.flush_model(["start_time", "end_time"])
+        now = fields.Datetime.now()
+        self.env.cr.execute(
+            """
+            WITH reverted AS (
+                DELETE FROM salezrace_pause_log
+                 WHERE end_time IS NULL
+                   AND start_time <= %(stale)s
+             RETURNING racer_id, checkpoint_id
+            ), journal AS (
+                INSERT INTO salezrace_timing_event (
+                    event_type, racer_id, checkpoint_id, event_time, user_id,
+                    create_uid, create_date, write_uid, write_date
+                )
+                SELECT 'pause_revert', racer_id, checkpoint_id, %(now)s, %(uid)s,
+                       %(uid)s, %(now)s, %(uid)s, %(now)s
+                  FROM reverted
+            )
+            SELECT racer_id, checkpoint_id FROM reverted
+            """,
+            {"stale": now - STALE_PAUSE_AGE, "now": now, "uid": self.env.uid},
+        )
+        rows = self.env.cr.fetchall()
+        if not rows:
+            return
+
+        self.invalidate_model()
+        racers = self.env["salezrace.racer"].browse(list({racer_id for racer_id, _checkpoint_id in rows}))
+        racers.invalidate_recordset(["pause_log_ids", "active_pause_log_id"])
+        racers.modified(["pause_log_ids"])
+        racers._bump_race_version()
+        racers._notify_race_event(
+            "pause_reverted",
+            checkpoint_ids=sorted({checkpoint_id for _racer_id, checkpoint_id in rows}),
+        )
+        _logger.info(
+            "SalezRace: reverted %d stale pauses for %d racers in %.1f ms",
+            len(rows), len(racers), (time.perf_counter() - started) * 1000,
+        )
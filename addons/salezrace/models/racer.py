@@ -1,18 +1,107 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import logging
+import re
+import time
+from contextlib import contextmanager
 from typing import List, Tuple
 
+import psycopg2
+
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError, ValidationError
 from odoo.http import request
 from odoo.osv import expression
-from datetime import timedelta 
+from odoo.tools.sql import create_index
+from datetime import datetime, timedelta
+
+from .instrumentation import instrumented
+from .result import refresh_results
+
+_logger = logging.getLogger(__name__)
+
+
+# Category pairs shown side by side on the dashboard and in the printed report.
+CATEGORY_PAIR_ORDER = [
+    ("MU6", "FU6"),
+    ("M6", "F6"),
+    ("M10", "F10"),
+    ("M14", "F14"),
+    ("M18", "F18"),
+    ("M31", "F31"),
+    ("M45", "F45"),
+]
+
+CATEGORY_AGES = {
+    'U6': '< 6',
+    '6': '6-9',
+    '10': '10-13',
+    '14': '14-17',
+    '18': '18-30',
+    '31': '31-44',
+    '45': '45+',
+}
+
+
+# Racer fields whose changes can alter the leaderboard and the results snapshot.
+LEADERBOARD_FIELDS = {"racer_no", "first_name", "last_name", "age", "gender", "start_time", "finish_time"}
+
+# Fields sent to the Finish screen for on-track racers and finishers.
+FINISH_BOARD_FIELDS = [
+    "id", "racer_no", "first_name", "last_name", "age", "gender",
+    "start_time", "finish_time", "final_time",
+]
+
+# Bus channel and notification type for race events pushed to the client actions.
+RACE_BUS_CHANNEL = "salezrace.race"
+RACE_BUS_EVENT = "salezrace/race_event"
+
+# Partial unique index on positive racer numbers (multiple 0s = unassigned are allowed).
+RACER_NO_UNIQUE_INDEX = "salezrace_racer_racer_no_positive_uniq"
+
+# Racers created per INSERT batch by the bulk import.
+IMPORT_CHUNK_SIZE = 1000
+
+# Accepted spellings of the gender column in imported files.
+IMPORT_GENDER_VALUES = {
+    "male": "male", "m": "male",
+    "female": "female", "f": "female",
+}
+
+# Advisory lock key serializing racer number allocation (see _allocate_racer_numbers).
+RACER_NO_LOCK_KEY = 0x5A1E2ACE
+
+# Fields returned by the Start screen racer lookup.
+START_LOOKUP_FIELDS = [
+    "id", "first_name", "last_name", "age", "gender", "category", "racer_no", "start_time",
+]
+
+# Client event types accepted by the offline replay, and the racer action each maps to.
+# A replayed event violating this constraint was already recorded.
+TIMING_EVENT_UUID_CONSTRAINT = "salezrace_timing_event_uuid_unique"
+REPLAY_ACTIONS = {
+    "finish": "action_finish_now",
+    "pause_start": "action_pause_start",
+    "pause_end": "action_pause_end",
+    "pause_revert": "action_pause_revert",
+    "pause_invalidate": "action_invalidate_logs",
+    "custom_time": "action_custom_time",
+}
+
+# Re-read window behind a delta token; write_date is the writing transaction's
+# start time, so a short transaction may commit slightly "in the past".
+FINISH_DELTA_OVERLAP = timedelta(seconds=10)
+
+# In-process leaderboard cache per database: {db_name: {podium_size: (version, rows)}}.
+_leaderboard_cache: dict = {}
+
 
 class SalezRaceRacer(models.Model):
     """Racer registration model."""
 
     _name = "salezrace.racer"
+    _inherit = ["salezrace.instrumented.mixin"]
     _description = "SalezRace Racer"
     _order = "id desc"  # newest first so new inline rows show on top
 
@@ -31,23 +120,31 @@ class SalezRaceRacer(models.Model):
     )
     start_time: fields.Datetime = fields.Datetime(readonly=True)
     finish_time: fields.Datetime = fields.Datetime(readonly=True)
+    net_time_seconds: fields.Integer = fields.Integer(
+        string="Net Time (s)",
+        compute="_compute_net_time_seconds",
+        store=True,
+        index=True,
+        help="finish_time - start_time - total_pause_time in seconds; used for all rankings.",
+    )
     final_time: fields.Char = fields.Char(
         string="Final Time",
         compute="_compute_final_time",
         store=True,
-        help="Computed as finish_time - start_time in mm:ss.",
+        help="Display form (mm:ss) of the net time.",
     )
     email = fields.Char()
     search_key = fields.Char(
         string="Search Key",
         compute="_compute_search_key",
         store=True,
-        index=True,
+        index="trigram",
         help="Concatenation of First, Last, Age, Gender, and Racer No for easier searching",
     )
 
     @api.depends("first_name", "last_name", "age", "gender", "racer_no")
     def _compute_search_key(self):
+        gender_labels = dict(self._fields["gender"].selection)
         for rec in self:
             parts = []
             if rec.first_name:
@@ -57,17 +154,12 @@ class SalezRaceRacer(models.Model):
             if rec.age:
                 parts.append(str(rec.age))
             if rec.gender:
-                parts.append(dict(rec._fields["gender"].selection).get(rec.gender, rec.gender))
+                parts.append(gender_labels.get(rec.gender, rec.gender))
             if rec.racer_no and rec.racer_no > 0:
                 parts.append(f"#{rec.racer_no}")
             else:
                 parts.append("no racer number")
             rec.search_key = ", ".join(parts) if parts else ""
-        # NOTE: we allow multiple 0s, so we DO NOT put a SQL unique constraint on racer_no.
-        # Uniqueness for positive numbers is enforced in Python below.
-        _sql_constraints = [
-            ("racer_no_unique", "unique(racer_no)", "Racer number must be unique."),
-        ]
 
 
     category = fields.Selection(
@@ -129,6 +221,22 @@ class SalezRaceRacer(models.Model):
             prefix = "M" if rec.gender == "male" else "F"
             rec.category = f"{prefix}{b}"
 
+    def init(self) -> None:
+        # Race version counter, bumped after every commit that changes results.
+        self.env.cr.execute("CREATE SEQUENCE IF NOT EXISTS salezrace_race_version_seq")
+        self.env.cr.execute(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS {RACER_NO_UNIQUE_INDEX} "
+            f"ON {self._table} (racer_no) WHERE racer_no > 0"
+        )
+        # Serves the per-category leaderboard: finishers ordered by net time.
+        create_index(
+            self.env.cr,
+            "salezrace_racer_category_net_time_idx",
+            self._table,
+            ["category", "net_time_seconds", "id"],
+            where="final_time IS NOT NULL",
+        )
+
     # -----------------------
     # CRUD
     # -----------------------
@@ -148,65 +256,106 @@ class SalezRaceRacer(models.Model):
                 raise ValidationError(_("Racer number must be an integer."))
             if vals["racer_no"] < 0:
                 raise ValidationError(_("Racer number cannot be negative."))
-        recs = super().create(vals_list)
-        recs._check_racer_no_unique_nonzero()
-        return recs
+        if not any(vals["racer_no"] for vals in vals_list):
+            return super().create(vals_list)
+        with self._racer_no_unique_guard():
+            return super().create(vals_list)
 
     def write(self, vals: dict) -> bool:
-        res = super().write(vals)
-        self._check_racer_no_unique_nonzero()
+        if vals.get("racer_no"):
+            with self._racer_no_unique_guard():
+                res = super().write(vals)
+                self.flush_recordset(["racer_no"])
+        else:
+            res = super().write(vals)
+        if LEADERBOARD_FIELDS.intersection(vals):
+            self._bump_race_version()
+        if "start_time" in vals:
+            self._notify_race_event("racer_started" if vals["start_time"] else "start_reverted")
+        if "finish_time" in vals:
+            self._notify_race_event("racer_finished" if vals["finish_time"] else "finish_reverted")
         return res
 
     def unlink(self) -> bool:
-        # No bus notifications anymore; just delete.
+        if any(rec.finish_time for rec in self):
+            self._bump_race_version()
         return super().unlink()
 
     def name_search(self, name="", args=None, operator="ilike", limit=100):
-        args = args or []
-        if not name:
-            recs = self.search(args, limit=limit)
-            return recs.name_get()
-
-        domain_parts = [
-            ("first_name", operator, name),
-            ("last_name", operator, name),
-        ]
-        if name.isdigit():
-            domain_parts.append(("racer_no", "=", int(name)))
-
-        or_domain = []
-        for i, cond in enumerate(domain_parts):
-            if i:
-                or_domain = ["|"] + or_domain
-            or_domain += [cond]
-
-        recs = self.search(expression.AND([args, or_domain]), limit=limit)
+        recs = self.browse(self._name_search(name, args or [], operator, limit=limit))
         return recs.name_get()
 
+    @api.model
+    def _name_search(self, name, domain=None, operator="ilike", limit=None, order=None):
+        """Racer lookup shared by name_search and many2one search filters."""
+        domain = domain or []
+        if not name:
+            return self._search(domain, limit=limit, order=order)
+        # A number is an exact racer number (search_key would also match ages
+        # and longer numbers containing it). Text is matched against
+        # search_key, which holds first/last name, age, gender and number and
+        # is trigram-indexed, so one condition replaces an OR over several columns.
+        if name.isdigit() and operator in ("ilike", "like", "=", "=ilike", "=like"):
+            name_domain = [("racer_no", "=", int(name))]
+        else:
+            name_domain = [("search_key", operator, name)]
+        return self._search(expression.AND([domain, name_domain]), limit=limit, order=order)
+
+    @api.model
+    @instrumented
+    def lookup_racer(self, query, limit: int = 10) -> List[dict]:
+        """Return the compact racer rows the Start screen needs in one call.
+
+        A purely numeric query is an exact racer number lookup (btree index on
+        racer_no); anything else is matched against the trigram-indexed search_key.
+        """
+        query = str(query or "").strip()
+        if not query:
+            return []
+        if query.isdigit():
+            return self.search_read([("racer_no", "=", int(query))], START_LOOKUP_FIELDS, limit=1)
+        return self.search_read([("search_key", "ilike", query)], START_LOOKUP_FIELDS,
+                                limit=limit, order="racer_no")
+
     # -----------------------
     # Constraints
     # -----------------------
-    @api.constrains("racer_no")
-    def _check_racer_no_unique_nonzero(self) -> None:
-        """Ensure that for racer_no > 0, the number is unique. Allow multiple 0s."""
-        for rec in self:
-            if rec.racer_no and rec.racer_no > 0:
-                dup = self.search_count([("id", "!=", rec.id), ("racer_no", "=", rec.racer_no)])
-                if dup:
-                    raise ValidationError(_("Racer number %s is already used.") % rec.racer_no)
+    @contextmanager
+    def _racer_no_unique_guard(self):
+        """Turn violations of the racer number unique index into a ValidationError.
+
+        Uniqueness of positive numbers is enforced by the partial unique index
+        created in init(); multiple 0s (unassigned) are allowed.
+        """
+        try:
+            with self.env.cr.savepoint():
+                yield
+        except psycopg2.errors.UniqueViolation as exc:
+            if exc.diag.constraint_name != RACER_NO_UNIQUE_INDEX:
+                raise
+            match = re.search(r"=\((\d+)\)", exc.diag.message_detail or "")
+            number = match.group(1) if match else ""
+            raise ValidationError(_("Racer number %s is already used.") % number) from None
 
     # -----------------------
     # Computations
     # -----------------------
     @api.depends("start_time", "finish_time", "total_pause_time")
+    def _compute_net_time_seconds(self) -> None:
+        """Compute the net race time in whole seconds (finish - start - pauses)."""
+        for rec in self:
+            rec.net_time_seconds = 0
+            if rec.start_time and rec.finish_time and rec.finish_time >= rec.start_time:
+                delta = fields.Datetime.to_datetime(rec.finish_time) - fields.Datetime.to_datetime(rec.start_time)
+                rec.net_time_seconds = int(delta.total_seconds() - rec.total_pause_time)
+
+    @api.depends("start_time", "finish_time", "net_time_seconds")
     def _compute_final_time(self) -> None:
-        """Compute mm:ss from finish_time - start_time."""
+        """Format net_time_seconds as mm:ss for display."""
         for rec in self:
             rec.final_time = False
             if rec.start_time and rec.finish_time and rec.finish_time >= rec.start_time:
-                delta = fields.Datetime.to_datetime(rec.finish_time) - fields.Datetime.to_datetime(rec.start_time)
-                total_seconds = int(delta.total_seconds() - rec.total_pause_time)
-                minutes, seconds = divmod(total_seconds, 60)
+                minutes, seconds = divmod(rec.net_time_seconds, 60)
                 rec.final_time = f"{minutes:02d}:{seconds:02d}"
 
     @api.depends("first_name", "last_name", "racer_no")
@@ -219,21 +368,334 @@ class SalezRaceRacer(models.Model):
     # -----------------------
     # Helpers for numbering
     # -----------------------
+    def _allocate_racer_numbers(self, fill_gaps: bool = False) -> dict:
+        """Assign numbers to the unnumbered racers of ``self`` in one UPDATE.
+
+        Racers are numbered in id order. In append mode numbers continue from
+        MAX(racer_no); with ``fill_gaps`` the smallest unused positive numbers
+        are taken (generate_series anti-joined against the used numbers).
+
+        Concurrent allocators are serialized with a transaction-level advisory
+        lock, so registration edits on the table are never blocked. The lock
+        does not refresh this transaction's (REPEATABLE READ) snapshot, so a
+        batch colliding with numbers committed meanwhile makes Postgres raise a
+        serialization failure (40001), which Odoo retries with a fresh snapshot.
+
+        :return: mapping of racer id to its new number.
+        """
+        if not self:
+            return {}
+        self.flush_model(["racer_no"])
+        cr = self.env.cr
+        cr.execute("SELECT pg_advisory_xact_lock(%s)", [RACER_NO_LOCK_KEY])
+        if fill_gaps:
+            numbers = """
+                SELECT n AS racer_no, ROW_NUMBER() OVER (ORDER BY n) AS rn
+                  FROM generate_series(
+                           1,
+                           (SELECT COALESCE(MAX(racer_no), 0) FROM salezrace_racer)
+                               + (SELECT COUNT(*) FROM todo)
+                       ) AS n
+                 WHERE NOT EXISTS (SELECT 1 FROM salezrace_racer used WHERE used.racer_no = n)
+            """
+        else:
+            numbers = """
+                SELECT base.max_no + todo.rn AS racer_no, todo.rn
+                  FROM todo,
+                       (SELECT COALESCE(MAX(racer_no), 0) AS max_no FROM salezrace_racer) AS base
+            """
+        try:
+            with cr.savepoint():
+                cr.execute(
+                f"""
+                WITH todo AS (
+                    SELECT id, ROW_NUMBER() OVER (ORDER BY id) AS rn
+                      FROM salezrace_racer
+                     WHERE id IN %s
+                       AND COALESCE(racer_no, 0) <= 0
+                ), numbers AS ({numbers})
+                UPDATE salezrace_racer racer
+                   SET racer_no = numbers.racer_no,
+                       write_uid = %s,
+                       write_date = (now() AT TIME ZONE 'UTC')
+                  FROM todo
+                  JOIN numbers ON numbers.rn = todo.rn
+                 WHERE racer.id = todo.id
+             RETURNING racer.id, racer.racer_no
+                """,
+                    [tuple(self.ids), self.env.uid],
+                )
+        except psycopg2.errors.UniqueViolation as exc:
+            if exc.diag.constraint_name != RACER_NO_UNIQUE_INDEX:
+                raise
+            # Numbers committed by another desk (or manually) after our snapshot
+            # was taken. Odoo only retries errors raised by the server (it
+            # checks the pgcode), so have Postgres raise the serialization failure.
+            cr.execute(
+                "DO $$ BEGIN RAISE EXCEPTION 'racer numbers assigned concurrently' "
+                "USING ERRCODE = 'serialization_failure'; END $$"
+            )
+        assigned = dict(cr.fetchall())
+        if assigned:
+            numbered = self.browse(list(assigned))
+            numbered.invalidate_recordset(["racer_no", "write_uid", "write_date"])
+            numbered.modified(["racer_no"])
+            # The raw UPDATE bypasses write(): renumbered finishers change the results.
+            if any(numbered.mapped("finish_time")):
+                numbered._bump_race_version()
+        return assigned
+
+    # -----------------------
+    # Bulk import
+    # -----------------------
+    @api.model
+    def _import_racers(self, rows, assign_numbers: str | bool = False) -> dict:
+        """Validate and create racers from parsed import rows.
+
+        Rows are validated one by one but created with one ``create()`` per
+        chunk of IMPORT_CHUNK_SIZE. A chunk that fails in the database is
+        retried row by row so only the offending rows are reported. Numbers are
+        assigned to all imported racers in a single allocation at the end.
+
+        :param rows: iterable of ``(line_no, values)``; values are keyed by field name.
+        :param assign_numbers: False, ``"append"`` or ``"fill_gaps"``.
+        :return: ``{"created": [racer ids], "errors": [(line_no, message)]}``
+        """
+        created_ids = []
+        errors = []
+        chunk = []
+        for line_no, values in rows:
+            vals, error = self._prepare_import_vals(values)
+            if error:
+                errors.append((line_no, error))
+                continue
+            chunk.append((line_no, vals))
+            if len(chunk) >= IMPORT_CHUNK_SIZE:
+                created_ids += self._create_import_chunk(chunk, errors)
+                chunk = []
+        if chunk:
+            created_ids += self._create_import_chunk(chunk, errors)
+
+        if assign_numbers and created_ids:
+            self.browse(created_ids)._allocate_racer_numbers(fill_gaps=assign_numbers == "fill_gaps")
+        return {"created": created_ids, "errors": errors}
+
+    @api.model
+    def _prepare_import_vals(self, values: dict) -> Tuple[dict, str]:
+        """Return ``(vals, error)`` for one imported row; error is "" when valid."""
+        vals = {}
+        for name in ("first_name", "last_name"):
+            text = str(values.get(name) or "").strip()
+            if not text:
+                return {}, _("%s is required.") % self._fields[name].string
+            vals[name] = text
+
+        try:
+            vals["age"] = int(float(values.get("age")))
+        except (TypeError, ValueError, OverflowError):
+            return {}, _("Age must be a number.")
+        if vals["age"] < 0:
+            return {}, _("Age cannot be negative.")
+
+        gender = IMPORT_GENDER_VALUES.get(str(values.get("gender") or "").strip().lower())
+        if not gender:
+            return {}, _("Gender must be male or female.")
+        vals["gender"] = gender
+
+        email = str(values.get("email") or "").strip()
+        if email:
+            vals["email"] = email
+
+        if values.get("racer_no") not in (None, ""):
+            try:
+                vals["racer_no"] = int(float(values["racer_no"]))
+            except (TypeError, ValueError, OverflowError):
+                return {}, _("Racer number must be an integer.")
+            if vals["racer_no"] < 0:
+                return {}, _("Racer number cannot be negative.")
+        return vals, ""
+
+    @api.model
+    def _create_import_chunk(self, chunk: List[Tuple[int, dict]], errors: list) -> List[int]:
+        """Create one chunk of validated rows; fall back to row by row on failure."""
+        try:
+            with self.env.cr.savepoint():
+                return self.create([vals for _line_no, vals in chunk]).ids
+        except (ValidationError, psycopg2.Error):
+            pass
+
+        created_ids = []
+        for line_no, vals in chunk:
+            try:
+                with self.env.cr.savepoint():
+                    created_ids += self.create(vals).ids
+            except (ValidationError, psycopg2.Error) as exc:
+                message = exc.args[0] if isinstance(exc, ValidationError) else exc.pgerror
+                errors.append((line_no, (message or "").strip()))
+        return created_ids
+
+    # -----------------------
+    # Race version (results snapshot and leaderboard cache invalidation)
+    # -----------------------
+    @api.model
+    def _bump_race_version(self) -> None:
+        """Bump the race version once the current transaction commits.
+
+        The bump runs after commit so that any worker observing the new version
+        is guaranteed to also see the data that caused it. The results snapshot
+        (``salezrace.result``) is not rebuilt here: readers find it older than
+        the race version and rebuild it on demand.
+        """
+        cr = self.env.cr
+        if cr.postcommit.data.get("salezrace.race_version_bump"):
+            return
+        cr.postcommit.data["salezrace.race_version_bump"] = True
+        registry = self.env.registry
+
+        @cr.postcommit.add
+        def bump():
+            with registry.cursor() as bump_cr:
+                bump_cr.execute("SELECT nextval('salezrace_race_version_seq')")
+
+    @api.model
+    def _get_race_version(self, cr=None) -> int:
+        """Return the current race version (shared by all workers)."""
+        cr = cr or self.env.cr
+        cr.execute("SELECT last_value FROM salezrace_race_version_seq")
+        return cr.fetchone()[0]
+
+    # -----------------------
+    # Timing journal
+    # -----------------------
+    def _record_timing_event(self, event_type: str, **vals):
+        """Append one timing event per racer in ``self`` and materialize it.
+
+        This is the only way timing actions change start/finish times and
+        pause logs; see ``salezrace.timing.event``.
+        """
+        # Replayed offline events pass their uuid and client time via context.
+        vals = {**self.env.context.get("salezrace_event_vals", {}), **vals}
+        events = self.env["salezrace.timing.event"].create([
+            {"event_type": event_type, "racer_id": racer.id, **vals} for racer in self
+        ])
+        events._materialize()
+        return events
+
     @api.model
-    def _next_racer_no_locked(self) -> int:
+    @instrumented
+    def action_replay_timing_events(self, events: List[dict]) -> List[dict]:
+        """Apply timing events recorded by (possibly offline) timing stations.
+
+        Idempotent: every event carries a client-generated ``uuid`` and events
+        already in the journal are reported as ``duplicate`` without being
+        applied again. Each event is applied in its own savepoint with the same
+        validation as the online action, using the client's (server-corrected)
+        timestamp, clamped to the current server time. Events earlier than
+        the racer's start (or a pause end earlier than its pause) are rejected,
+        and an unexpected error rejects only its own event.
+
+        :param events: ``{"uuid", "type", "racer_id", "time_ms", "checkpoint_id"?, "custom_time"?}``
+            where type is a key of REPLAY_ACTIONS and time_ms is epoch milliseconds.
+        :return: ``{"uuid", "status", "message"}`` per event, status being
+            ``applied``, ``duplicate`` or ``rejected``.
         """
-        Return max(racer_no) + 1 while holding a table-level lock to serialize
-        concurrent assignments. This respects manual assignments naturally.
+        uuids = [event.get("uuid") for event in events if event.get("uuid")]
+        recorded = set(self.env["salezrace.timing.event"].search([("uuid", "in", uuids)]).mapped("uuid"))
+        self.browse([event.get("racer_id") for event in events if event.get("racer_id")]).exists()
+        now = fields.Datetime.now()
+
+        results = []
+        for event in sorted(events, key=lambda event: event.get("time_ms") or 0):
+            uuid = event.get("uuid")
+            result = {"uuid": uuid, "status": "rejected", "message": ""}
+            results.append(result)
+            racer = self.browse(event.get("racer_id") or []).exists()
+            if not uuid or event.get("type") not in REPLAY_ACTIONS:
+                result["message"] = _("Unknown timing event.")
+                continue
+            if uuid in recorded:
+                result["status"] = "duplicate"
+                continue
+            if not racer:
+                result["message"] = _("Racer not found.")
+                continue
+
+            try:
+                with self.env.cr.savepoint():
+                    racer._replay_timing_event(event, now)
+            except psycopg2.IntegrityError as exc:
+                if exc.diag.constraint_name != TIMING_EVENT_UUID_CONSTRAINT:
+                    result["message"] = exc.diag.message_primary or _("The timing event could not be recorded.")
+                else:
+                    # Replayed concurrently from another tab: already recorded.
+                    result["status"] = "duplicate"
+            except (UserError, ValidationError) as exc:
+                result["message"] = exc.args[0]
+            except psycopg2.extensions.TransactionRollbackError:
+                # Serialization failure or deadlock: Odoo retries the whole batch.
+                raise
+            except Exception as exc:
+                # Never fail the batch: the station would resend it forever.
+                _logger.exception("SalezRace: replaying timing event %s failed", uuid)
+                result["message"] = _("The timing event could not be applied: %s", exc)
+            else:
+                result["status"] = "applied"
+                recorded.add(uuid)
+        return results
+
+    def _replay_timing_event(self, event: dict, now: datetime) -> None:
+        """Apply one replayed event to this racer (see ``action_replay_timing_events``)."""
+        self.ensure_one()
+        event_time = now
+        if event.get("time_ms"):
+            event_time = min(datetime.utcfromtimestamp(event["time_ms"] / 1000).replace(microsecond=0), now)
+        if self.start_time and event_time < self.start_time:
+            raise UserError(_("This timing event is earlier than the racer's start."))
+        if (
+            event["type"] == "pause_end"
+            and self.active_pause_log_id
+            and event_time < self.active_pause_log_id.start_time
+        ):
+            raise UserError(_("This pause end is earlier than the pause start."))
+
+        args = []
+        if event["type"] in ("pause_start", "pause_invalidate", "custom_time"):
+            args.append(event.get("checkpoint_id"))
+        if event["type"] == "custom_time":
+            args.append(int(event.get("custom_time") or 0))
+        action = getattr(
+            self.with_context(salezrace_event_vals={"uuid": event["uuid"], "event_time": event_time}),
+            REPLAY_ACTIONS[event["type"]],
+        )
+        action(*args)
+
+    @instrumented
+    def action_rebuild_from_journal(self):
+        """Rebuild the selected racers' times and pauses from the timing journal."""
+        self.env["salezrace.timing.event"]._rebuild_racers(self)
+        return True
+
+    # -----------------------
+    # Bus events
+    # -----------------------
+    def _notify_race_event(self, event: str, **payload) -> None:
+        """Publish a compact race event about these racers on the bus.
+
+        The notification is delivered after commit. It carries the racers'
+        Finish board rows so clients can patch their state without a re-read.
         """
-        # Serialize concurrent "next number" computations
-        self.env.cr.execute("LOCK TABLE salezrace_racer IN SHARE ROW EXCLUSIVE MODE")
-        self.env.cr.execute("SELECT COALESCE(MAX(racer_no), 0) FROM salezrace_racer")
-        current_max = self.env.cr.fetchone()[0] or 0
-        return int(current_max) + 1
+        if not self:
+            return
+        self.env["bus.bus"]._sendone(RACE_BUS_CHANNEL, RACE_BUS_EVENT, {
+            "event": event,
+            "racers": self.read(FINISH_BOARD_FIELDS),
+            **payload,
+        })
 
     # -----------------------
     # Actions
     # -----------------------
+    @instrumented
     def action_start(self) -> None:
         """Record the start time as the current server time.
 
@@ -244,8 +706,69 @@ class SalezRaceRacer(models.Model):
             raise UserError(_("Cannot start a racer with number 0. Please assign a number first."))
         if self.start_time:
             raise UserError(_("This racer has already started."))
-        self.write({"start_time": fields.Datetime.now()})
+        self._record_timing_event("start")
 
+    @instrumented
+    def action_revert_start(self) -> None:
+        """Remove the start (and any finish) time of this racer."""
+        self.ensure_one()
+        if not self.start_time:
+            raise UserError(_("This racer has not started yet."))
+        self._record_timing_event("start_revert")
+
+    @api.model
+    @instrumented
+    def action_start_wave(self, racer_nos: List[int]) -> List[dict]:
+        """Start a whole wave of racers at one shared server timestamp.
+
+        All numbers are resolved with a single search and every valid racer is
+        written in one UPDATE. Invalid numbers do not block the rest of the wave.
+
+        :param racer_nos: racer numbers to start.
+        :return: one result per requested number, in input order:
+            ``{"racer_no", "id", "status", "message"}`` where status is one of
+            ``started``, ``invalid_number``, ``not_found``, ``already_started``
+            or ``duplicate``.
+        """
+        numbers = []
+        for no in racer_nos or []:
+            try:
+                numbers.append(int(no))
+            except (TypeError, ValueError):
+                numbers.append(0)
+
+        racers = self.search([("racer_no", "in", [no for no in numbers if no > 0])])
+        by_no = {racer.racer_no: racer for racer in racers}
+
+        results = []
+        to_start = self.browse()
+        seen = set()
+        for no in numbers:
+            racer = by_no.get(no)
+            result = {"racer_no": no, "id": racer.id if racer else False}
+            if no <= 0:
+                result.update(status="invalid_number", message=_("Cannot start a racer with number 0. Please assign a number first."))
+            elif no in seen:
+                result.update(status="duplicate", message=_("Racer number %s is listed more than once.") % no)
+            elif not racer:
+                result.update(status="not_found", message=_("Racer %s not found.") % no)
+            elif racer.start_time:
+                result.update(status="already_started", message=_("This racer has already started."))
+            else:
+                result.update(status="started", message="")
+                to_start |= racer
+            seen.add(no)
+            results.append(result)
+
+        if to_start:
+            now = fields.Datetime.now()
+            to_start._record_timing_event("start", event_time=now)
+            for result in results:
+                if result["status"] == "started":
+                    result["start_time"] = now
+        return results
+
+    @instrumented
     def action_finish_now(self) -> None:
         """Mark this racer as finished at server time 'now'."""
         self.ensure_one()
@@ -253,31 +776,25 @@ class SalezRaceRacer(models.Model):
             raise UserError(_("This racer has not started yet."))
         if self.finish_time:
             raise UserError(_("This racer already has a finish time."))
-        self.write({"finish_time": fields.Datetime.now()})
+        self._record_timing_event("finish")
+
+    @instrumented
+    def action_revert_finish(self) -> None:
+        """Remove the finish time of this racer."""
+        self.ensure_one()
+        if not self.finish_time:
+            raise UserError(_("This racer has no finish time."))
+        self._record_timing_event("finish_revert")
 
+    @instrumented
     def action_assign_number(self) -> None:
         """
         Assign the next available sequential number to records that have racer_no == 0.
         - Works in batch if multiple records are selected.
-        - Atomic and robust against concurrent assignments.
+        - One set-based UPDATE; concurrent allocations are serialized.
         - Manual numbers are respected (we always compute from MAX in DB).
         """
-        records = self.sorted("id")
-        if not records:
-            return
-
-        to_assign = records.filtered(lambda r: not r.racer_no)
-        if not to_assign:
-            # Nothing to do (all already numbered)
-            return
-
-        # Single savepoint & table lock; compute once and assign consecutively.
-        with self.env.cr.savepoint():
-            base = self._next_racer_no_locked()
-            next_no = base
-            for rec in to_assign:
-                rec.write({"racer_no": next_no})
-                next_no += 1
+        self._allocate_racer_numbers()
 
     # -----------------------
     # Display helpers
@@ -307,6 +824,7 @@ class SalezRaceRacer(models.Model):
             },
         }
 
+    @instrumented
     def action_assign_smallest_numbers(self):
         """
         Assign the smallest positive unused integer to each selected racer that
@@ -315,30 +833,7 @@ class SalezRaceRacer(models.Model):
 
         Usage (from UI): select rows in the list view → Action ▸ Assign Numbers.
         """
-        # Work only on unnumbered records; deterministic order
-        to_fill = self.filtered(lambda r: not r.racer_no or r.racer_no <= 0).sorted(key=lambda r: r.id)
-        if not to_fill:
-            return True
-
-        cr = self.env.cr
-        # Lock the set of used numbers so concurrent actions won't collide
-        cr.execute("""
-            SELECT racer_no
-              FROM salezrace_racer
-             WHERE racer_no IS NOT NULL AND racer_no > 0
-             FOR UPDATE
-        """)
-        used = {row[0] for row in cr.fetchall()}
-
-        # Find the smallest free number and assign it, updating the set as we go
-        next_candidate = 1
-        for rec in to_fill:
-            while next_candidate in used:
-                next_candidate += 1
-            rec.write({"racer_no": next_candidate})
-            used.add(next_candidate)
-            next_candidate += 1
-
+        self._allocate_racer_numbers(fill_gaps=True)
         return True
 
     pause_log_ids = fields.One2many(
@@ -375,29 +870,59 @@ class SalezRaceRacer(models.Model):
 
     @api.depends("pause_log_ids.is_invalid", "pause_log_ids.start_time", "pause_log_ids.end_time")
     def _compute_total_pause_time(self):
-        for racer in self:
+        # One aggregated query for the whole batch instead of loading every log.
+        saved = self.filtered("id")
+        totals = {}
+        if saved:
+            groups = self.env["salezrace.pause.log"]._read_group(
+                [("racer_id", "in", saved.ids), ("is_invalid", "=", False)],
+                groupby=["racer_id"],
+                aggregates=["duration:sum"],
+            )
+            totals = {racer.id: duration for racer, duration in groups}
+        for racer in saved:
+            racer.total_pause_time = totals.get(racer.id, 0.0)
+        # Unsaved (onchange) records only have their logs in memory.
+        for racer in self - saved:
             racer.total_pause_time = sum(racer.pause_log_ids.filtered(lambda log: not log.is_invalid).mapped("duration"))
 
     @api.depends("pause_log_ids.start_time", "pause_log_ids.end_time")
     def _compute_active_pause_log_id(self):
-        for racer in self:
+        saved = self.filtered("id")
+        active = {}
+        if saved:
+            PauseLog = self.env["salezrace.pause.log"]
+            PauseLog.flush_model(["racer_id", "start_time", "end_time"])
+            self.env.cr.execute(
+                """
+                SELECT DISTINCT ON (racer_id) racer_id, id
+                  FROM salezrace_pause_log
+                 WHERE racer_id IN %s
+                   AND end_time IS NULL
+                   AND start_time IS NOT NULL
+                 ORDER BY racer_id, id
+                """,
+                [tuple(saved.ids)],
+            )
+            active = dict(self.env.cr.fetchall())
+        for racer in saved:
+            racer.active_pause_log_id = active.get(racer.id, False)
+        for racer in self - saved:
             active_log = racer.pause_log_ids.filtered(
                 lambda log: log.start_time and not log.end_time
             )
             racer.active_pause_log_id = active_log[:1]
 
+    @instrumented
     def action_pause_start(self, checkpoint_id):
         self.ensure_one()
         if self.active_pause_log_id:
             raise UserError(_("This racer already has an active pause."))
-        
-        self.env["salezrace.pause.log"].create({
-            "racer_id": self.id,
-            "checkpoint_id": checkpoint_id,
-            "start_time": fields.Datetime.now(),
-        })
+
+        self._record_timing_event("pause_start", checkpoint_id=checkpoint_id)
         return self._get_racer_pause_state()
 
+    @instrumented
     def action_pause_end(self):
         self.ensure_one()
         if not self.active_pause_log_id:
@@ -406,9 +931,10 @@ class SalezRaceRacer(models.Model):
         if self.active_pause_log_id.user_id != self.env.user:
             raise UserError(_("Only the person that started the pause can end it."))
 
-        self.active_pause_log_id.write({"end_time": fields.Datetime.now()})
+        self._record_timing_event("pause_end", checkpoint_id=self.active_pause_log_id.checkpoint_id.id)
         return self._get_racer_pause_state()
 
+    @instrumented
     def action_pause_revert(self):
         self.ensure_one()
         if not self.active_pause_log_id:
@@ -417,31 +943,73 @@ class SalezRaceRacer(models.Model):
         if self.active_pause_log_id.user_id != self.env.user:
             raise UserError(_("Only the person that started the pause can revert it."))
 
-        self.active_pause_log_id.unlink()
+        self._record_timing_event("pause_revert", checkpoint_id=self.active_pause_log_id.checkpoint_id.id)
         return self._get_racer_pause_state()
 
+    @instrumented
     def action_invalidate_logs(self, checkpoint_id):
         self.ensure_one()
-        pause_logs = self.env["salezrace.pause.log"].search([
-            ("racer_id", "=", self.id),
-            ("checkpoint_id", "=", checkpoint_id),
-        ])
-        pause_logs.write({"is_invalid": True})
+        self._record_timing_event("pause_invalidate", checkpoint_id=checkpoint_id)
         return True
 
+    @instrumented
     def action_custom_time(self, checkpoint_id, custom_time):
         self.ensure_one()
-        self.action_invalidate_logs(checkpoint_id)
-        now = fields.Datetime.now()
-        self.env["salezrace.pause.log"].create({
-            "racer_id": self.id,
-            "checkpoint_id": checkpoint_id,
-            "start_time": now,
-            "end_time": now + timedelta(seconds=custom_time),
-            "is_custom": True,
-        })
+        self._record_timing_event("custom_time", checkpoint_id=checkpoint_id, duration=int(custom_time))
         return True
 
+    @api.model
+    @instrumented
+    def get_pause_board(self, checkpoint_id: int) -> dict:
+        """Return the Pause screen for one checkpoint in a single query.
+
+        Each on-track racer comes with its active pause (at any checkpoint),
+        its valid pause time at ``checkpoint_id`` and its total valid pause.
+        ``server_time_ms`` lets the client compute a clock offset so live
+        pause timers run on server time.
+        """
+        self.flush_model(["start_time", "finish_time", "total_pause_time", "racer_no", "first_name", "last_name"])
+        self.env["salezrace.pause.log"].flush_model()
+        self.env["salezrace.checkpoint"].flush_model(["name"])
+        self.env.cr.execute(
+            """
+            SELECT r.id, r.racer_no, r.first_name, r.last_name, r.start_time,
+                   r.total_pause_time,
+                   active.id AS active_pause_log_id,
+                   active.start_time AS active_pause_start_time,
+                   active.user_id AS active_pause_user_id,
+                   active.checkpoint_id AS active_pause_checkpoint_id,
+                   checkpoint.name AS active_pause_checkpoint_name,
+                   COALESCE(here.duration, 0) AS checkpoint_pause_time
+              FROM salezrace_racer r
+              LEFT JOIN LATERAL (
+                    SELECT id, start_time, user_id, checkpoint_id
+                      FROM salezrace_pause_log
+                     WHERE racer_id = r.id
+                       AND end_time IS NULL
+                       AND start_time IS NOT NULL
+                     ORDER BY id
+                     LIMIT 1
+                   ) active ON TRUE
+              LEFT JOIN salezrace_checkpoint checkpoint ON checkpoint.id = active.checkpoint_id
+              LEFT JOIN (
+                    SELECT racer_id, SUM(duration) AS duration
+                      FROM salezrace_pause_log
+                     WHERE checkpoint_id = %s
+                       AND is_invalid IS NOT TRUE
+                     GROUP BY racer_id
+                   ) here ON here.racer_id = r.id
+             WHERE r.start_time IS NOT NULL
+               AND r.finish_time IS NULL
+             ORDER BY r.start_time, r.id
+            """,
+            [checkpoint_id],
+        )
+        return {
+            "racers": self.env.cr.dictfetchall(),
+            "server_time_ms": int(time.time() * 1000),
+        }
+
     def _get_racer_pause_state(self):
         self.ensure_one()
         return {
@@ -465,47 +1033,68 @@ class SalezRaceRacer(models.Model):
         }
 
     @api.model
-    def get_dashboard_data(self):
-        racers = self.search([
-            ("finish_time", "!=", False),
-            ("final_time", "!=", False)
-        ], order="final_time asc")
+    def _get_leaderboard_rows(self, podium_size: int = 3) -> List[dict]:
+        """Return the per-category podium rows, cached per race version.
+
+        A hit costs one sequence read and an integer comparison. On a miss the
+        rows are read from the results snapshot in a fresh cursor and cached
+        under the snapshot's own version, so a snapshot still being rebuilt
+        is never cached as current.
+        """
+        if self.env.cr.postcommit.data.get("salezrace.race_version_bump"):
+            # Uncommitted result changes in this transaction: bypass the cache.
+            self.env["salezrace.result"]._ensure_fresh()
+            return self._compute_leaderboard_rows(podium_size)
 
-        top3_ids = racers[:3].ids
+        db_cache = _leaderboard_cache.setdefault(self.env.cr.dbname, {})
+        cached = db_cache.get(podium_size)
+        race_version = self._get_race_version()
+        if cached and cached[0] == race_version:
+            return [dict(row) for row in cached[1]]
 
+        if self.env["salezrace.result"]._get_results_version() < race_version:
+            refresh_results(self.env.registry)
+        with self.env.registry.cursor() as cr:
+            env = self.env(cr=cr)
+            version = env["salezrace.result"]._get_results_version()
+            rows = self.with_env(env)._compute_leaderboard_rows(podium_size)
+        db_cache[podium_size] = (version, rows)
+        return [dict(row) for row in rows]
+
+    @api.model
+    def _compute_leaderboard_rows(self, podium_size: int = 3) -> List[dict]:
+        """Return the per-category podium rows from the results snapshot.
+
+        Only the top ``podium_size`` of each category are returned, ordered by
+        category and category rank.
+        """
+        self.env["salezrace.result"].flush_model()
+        self.env.cr.execute(
+            """
+            SELECT racer_id AS id, age, first_name, last_name, final_time, category, overall_rank
+              FROM salezrace_result
+             WHERE category IS NOT NULL
+               AND category_rank <= %s
+             ORDER BY category, category_rank
+            """,
+            [podium_size],
+        )
+        rows = self.env.cr.dictfetchall()
+        for row in rows:
+            if row["overall_rank"] > podium_size:
+                row["overall_rank"] = 0
+        return rows
+
+    @api.model
+    @instrumented
+    def get_dashboard_data(self):
         category_groups = {}
-        for racer in racers:
-            rank = top3_ids.index(racer.id) + 1 if racer.id in top3_ids else 0
-            if racer.category not in category_groups:
-                category_groups[racer.category] = []
-            
-            if len(category_groups[racer.category]) < 3:
-                racer_data = racer.read(["age", "first_name", "last_name", "final_time"])[0]
-                racer_data['overall_rank'] = rank
-                category_groups[racer.category].append(racer_data)
-
-        category_pair_order = [
-            ("MU6", "FU6"),
-            ("M6", "F6"),
-            ("M10", "F10"),
-            ("M14", "F14"),
-            ("M18", "F18"),
-            ("M31", "F31"),
-            ("M45", "F45"),
-        ]
-
-        category_ages = {
-            'U6': '< 6',
-            '6': '6-9',
-            '10': '10-13',
-            '14': '14-17',
-            '18': '18-30',
-            '31': '31-44',
-            '45': '45+',
-        }
+        for row in self._get_leaderboard_rows():
+            category = row.pop("category")
+            category_groups.setdefault(category, []).append(row)
 
         category_pairs = []
-        for male_cat, female_cat in category_pair_order:
+        for male_cat, female_cat in CATEGORY_PAIR_ORDER:
             male_racers = category_groups.get(male_cat, [])
             female_racers = category_groups.get(female_cat, [])
 
@@ -513,10 +1102,64 @@ class SalezRaceRacer(models.Model):
                 male_racers.append({})
             while len(female_racers) < 3:
                 female_racers.append({})
-            
+
             category_pairs.append({
-                'male': { 'category': male_cat, 'racers': male_racers, 'age_range': category_ages[male_cat[1:]] },
-                'female': { 'category': female_cat, 'racers': female_racers, 'age_range': category_ages[female_cat[1:]] },
+                'male': { 'category': male_cat, 'racers': male_racers, 'age_range': CATEGORY_AGES[male_cat[1:]] },
+                'female': { 'category': female_cat, 'racers': female_racers, 'age_range': CATEGORY_AGES[female_cat[1:]] },
             })
 
-        return category_pairs
\ No newline at end of file
+        return category_pairs
+
+    # -----------------------
+    # Finish board
+    # -----------------------
+    @api.model
+    @instrumented
+    def get_finish_board_delta(self, since_token: str | None = None) -> dict:
+        """Return the Finish screen rows changed since ``since_token``.
+
+        Without a token (or with an unparsable one) a full snapshot is returned
+        and ``reset`` is True. Otherwise only racers written since the token
+        (minus a small overlap window) are returned; racers that no longer have
+        a start time are listed in ``removed_ids``. Racers with a finish time go
+        to ``finishers`` (a reverted finish moves back to ``on_track``).
+
+        ``counts`` holds the server-side list sizes so the client can detect
+        drift (e.g. deleted racers) and ask for a full snapshot again.
+        """
+        token = fields.Datetime.to_string(self.env.cr.now())
+        since = False
+        if since_token:
+            try:
+                since = fields.Datetime.to_datetime(since_token)
+            except ValueError:
+                since = False
+
+        if since:
+            changed = self.search([("write_date", ">=", since - FINISH_DELTA_OVERLAP)])
+            removed_ids = changed.filtered(lambda r: not r.start_time).ids
+            rows = changed.filtered("start_time").read(FINISH_BOARD_FIELDS)
+        else:
+            removed_ids = []
+            rows = self.search([("start_time", "!=", False)]).read(FINISH_BOARD_FIELDS)
+
+        self.flush_model(["start_time", "finish_time"])
+        self.env.cr.execute(
+            """
+            SELECT COUNT(*) FILTER (WHERE finish_time IS NULL),
+                   COUNT(*) FILTER (WHERE finish_time IS NOT NULL)
+              FROM salezrace_racer
+             WHERE start_time IS NOT NULL
+            """
+        )
+        on_track_count, finishers_count = self.env.cr.fetchone()
+
+        return {
+            "token": token,
+            "server_time_ms": int(time.time() * 1000),
+            "reset": not since,
+            "on_track": [row for row in rows if not row["finish_time"]],
+            "finishers": [row for row in rows if row["finish_time"]],
+            "removed_ids": removed_ids,
+            "counts": {"on_track": on_track_count, "finishers": finishers_count},
+        }
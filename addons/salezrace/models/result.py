@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import logging
+
+import psycopg2
+
+from odoo import SUPERUSER_ID, api, fields, models, _
+
+_logger = logging.getLogger(__name__)
+
+# A refresh that collides with a concurrent one is retried in a new transaction.
+RESULT_REFRESH_ATTEMPTS = 3
+# Advisory lock key held by the worker rebuilding the snapshot (see refresh_results).
+RESULT_REFRESH_LOCK_KEY = 0x5A1E2E5F
+
+
+def refresh_results(registry) -> None:
+    """Rebuild the results snapshot in its own transaction, unless it is current.
+
+    The lock attempt and the race version are the transaction's first read, so
+    the snapshot always contains the data behind the version it is labelled
+    with. One worker rebuilds at a time; the others return at once, as does a
+    worker finding the snapshot already at the race version. A rebuild that
+    still collides with a concurrent one is retried.
+    """
+    for _attempt in range(RESULT_REFRESH_ATTEMPTS):
+        try:
+            with registry.cursor() as cr:
+                cr.execute(
+                    "SELECT pg_try_advisory_xact_lock(%s), last_value FROM salezrace_race_version_seq",
+                    [RESULT_REFRESH_LOCK_KEY],
+                )
+                locked, version = cr.fetchone()
+                if not locked:
+                    return  # another worker is rebuilding
+                results = api.Environment(cr, SUPERUSER_ID, {})["salezrace.result"]
+                if results._get_results_version() < version:
+                    results._refresh(version)
+            return
+        except psycopg2.errors.SerializationFailure:
+            continue
+    _logger.warning("Results snapshot refresh kept conflicting; it is retried on the next read.")
+
+
+class SalezRaceResult(models.Model):
+    """Snapshot of the race results, one row per finisher.
+
+    Rows are rebuilt by one bulk SQL statement when read while older than the
+    race version; printed results, exports and the dashboard read them
+    instead of ranking racers themselves.
+    """
+
+    _name = "salezrace.result"
+    _description = "SalezRace Result"
+    _order = "overall_rank"
+    _log_access = False
+
+    racer_id: fields.Many2one = fields.Many2one(
+        "salezrace.racer", required=True, readonly=True, ondelete="cascade", index=True
+    )
+    racer_no: fields.Integer = fields.Integer(readonly=True)
+    first_name: fields.Char = fields.Char(readonly=True)
+    last_name: fields.Char = fields.Char(readonly=True)
+    age: fields.Integer = fields.Integer(readonly=True)
+    gender: fields.Selection = fields.Selection(
+        selection=[("male", "Male"), ("female", "Female")], readonly=True
+    )
+    category: fields.Char = fields.Char(readonly=True, index=True)
+    net_time_seconds: fields.Integer = fields.Integer(string="Net Time (s)", readonly=True)
+    final_time: fields.Char = fields.Char(string="Final Time", readonly=True)
+    overall_rank: fields.Integer = fields.Integer(readonly=True)
+    category_rank: fields.Integer = fields.Integer(readonly=True)
+    gender_rank: fields.Integer = fields.Integer(readonly=True)
+    gap_seconds: fields.Integer = fields.Integer(
+        string="Gap (s)", readonly=True, help="Net time behind the overall leader."
+    )
+    gap: fields.Char = fields.Char(readonly=True, help="Gap to the overall leader as +mm:ss.")
+    category_gap_seconds: fields.Integer = fields.Integer(
+        string="Category Gap (s)", readonly=True, help="Net time behind the category leader."
+    )
+
+    def init(self) -> None:
+        # One-row table holding the race version the snapshot was built from.
+        self.env.cr.execute("CREATE TABLE IF NOT EXISTS salezrace_result_state (version bigint NOT NULL)")
+        self.env.cr.execute(
+            "INSERT INTO salezrace_result_state (version) "
+            "SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM salezrace_result_state)"
+        )
+
+    @api.model
+    def _get_results_version(self, cr=None) -> int:
+        """Return the race version of the current snapshot."""
+        cr = cr or self.env.cr
+        cr.execute("SELECT version FROM salezrace_result_state")
+        return cr.fetchone()[0]
+
+    @api.model
+    def _refresh(self, version: int) -> None:
+        """Rebuild all result rows from the racers in one statement."""
+        self.env["salezrace.racer"].flush_model([
+            "racer_no", "first_name", "last_name", "age", "gender", "category", "net_time_seconds", "final_time",
+        ])
+        self.env.cr.execute(
+            """
+            WITH state AS (
+                UPDATE salezrace_result_state SET version = %s
+            ), cleared AS (
+                DELETE FROM salezrace_result
+            ), ranked AS (
+                SELECT id, racer_no, first_name, last_name, age, gender, category,
+                       net_time_seconds, final_time,
+                       ROW_NUMBER() OVER (ORDER BY net_time_seconds, id) AS overall_rank,
+                       ROW_NUMBER() OVER (PARTITION BY category ORDER BY net_time_seconds, id) AS category_rank,
+                       ROW_NUMBER() OVER (PARTITION BY gender ORDER BY net_time_seconds, id) AS gender_rank,
+                       net_time_seconds - MIN(net_time_seconds) OVER () AS gap_seconds,
+                       net_time_seconds - MIN(net_time_seconds) OVER (PARTITION BY category) AS category_gap_seconds
+                  FROM salezrace_racer
+                 WHERE final_time IS NOT NULL
+            )
+            INSERT INTO salezrace_result (
+                racer_id, racer_no, first_name, last_name, age, gender, category,
+                net_time_seconds, final_time, overall_rank, category_rank, gender_rank,
+                gap_seconds, gap, category_gap_seconds
+            )
+            SELECT id, racer_no, first_name, last_name, age, gender, category,
+                   net_time_seconds, final_time, overall_rank, category_rank, gender_rank,
+                   gap_seconds,
+                   '+' || lpad((gap_seconds / 60)::text, 2, '0') || ':' || lpad((gap_seconds %% 60)::text, 2, '0'),
+                   category_gap_seconds
+              FROM ranked
+            """,
+            [version],
+        )
+        self.invalidate_model()
+
+    @api.model
+    def _ensure_fresh(self) -> None:
+        """Refresh the snapshot in this transaction if it lags behind the race.
+
+        Also refreshes when this transaction changed results itself (their
+        version bump is still pending), so it reads its own changes.
+        """
+        race_version = self.env["salezrace.racer"]._get_race_version()
+        if (
+            self.env.cr.postcommit.data.get("salezrace.race_version_bump")
+            or self._get_results_version() < race_version
+        ):
+            self._refresh(race_version)
+
+    @api.model
+    def action_open_results(self):
+        """Open the (fresh) results list."""
+        self._ensure_fresh()
+        return {
+            "type": "ir.actions.act_window",
+            "name": _("Results"),
+            "res_model": self._name,
+            "view_mode": "tree",
+            "target": "current",
+        }
+
+    @api.model
+    def action_refresh_results(self):
+        """Rebuild the snapshot now and reload the view."""
+        self._refresh(self.env["salezrace.racer"]._get_race_version())
+        return {"type": "ir.actions.client", "tag": "reload"}
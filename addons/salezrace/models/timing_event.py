@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import timedelta
+from itertools import groupby
+
+from odoo import api, fields, models, _
+from odoo.exceptions import UserError
+
+
+EVENT_TYPES = [
+    ("start", "Start"),
+    ("start_revert", "Start Reverted"),
+    ("finish", "Finish"),
+    ("finish_revert", "Finish Reverted"),
+    ("set_times", "Times Edited"),
+    ("pause_start", "Pause Started"),
+    ("pause_end", "Pause Ended"),
+    ("pause_revert", "Pause Reverted"),
+    ("pause_invalidate", "Pauses Invalidated"),
+    ("custom_time", "Custom Pause Time"),
+]
+
+
+class SalezRaceTimingEvent(models.Model):
+    """Append-only journal of every timing action.
+
+    Timing actions only INSERT rows here; racer start/finish times and pause
+    logs are materialized from the journal by ``_materialize`` and can be
+    rebuilt deterministically with ``_rebuild_racers``.
+    """
+
+    _name = "salezrace.timing.event"
+    _description = "SalezRace Timing Event"
+    _order = "id desc"
+
+    event_type: fields.Selection = fields.Selection(selection=EVENT_TYPES, required=True, index=True)
+    racer_id: fields.Many2one = fields.Many2one(
+        "salezrace.racer", required=True, ondelete="cascade", index=True
+    )
+    event_time: fields.Datetime = fields.Datetime(required=True, default=fields.Datetime.now)
+    checkpoint_id: fields.Many2one = fields.Many2one("salezrace.checkpoint", ondelete="set null")
+    duration: fields.Integer = fields.Integer(help="Custom pause time in seconds.")
+    start_time: fields.Datetime = fields.Datetime(help="New start time of a 'Times Edited' event.")
+    finish_time: fields.Datetime = fields.Datetime(help="New finish time of a 'Times Edited' event.")
+    finish_log_id: fields.Many2one = fields.Many2one("salezrace.finish.log", ondelete="set null")
+    user_id: fields.Many2one = fields.Many2one(
+        "res.users", string="Recorded By", default=lambda self: self.env.user
+    )
+    uuid: fields.Char = fields.Char(
+        string="Client Event ID",
+        readonly=True,
+        copy=False,
+        help="Set by timing stations so replayed (offline) events are applied only once.",
+    )
+
+    _sql_constraints = [
+        ("uuid_unique", "unique(uuid)", "This timing event was already recorded."),
+    ]
+
+    # -----------------------
+    # Append-only
+    # -----------------------
+    def write(self, vals):
+        raise UserError(_("Timing events are append-only and cannot be modified."))
+
+    def unlink(self):
+        raise UserError(_("Timing events are append-only and cannot be deleted."))
+
+    # -----------------------
+    # Materializer
+    # -----------------------
+    def _materialize(self) -> None:
+        """Apply these events, in id order, to racer and pause log state.
+
+        Consecutive events of the same type are applied as one batch (e.g. a
+        wave start is a single UPDATE of all its racers).
+        """
+        for event_type, batch in groupby(self.sorted("id"), key=lambda event: event.event_type):
+            events = self.browse([event.id for event in batch])
+            getattr(events, f"_apply_{event_type}")()
+
+    def _apply_start(self) -> None:
+        for event_time, events in self._group_by_time():
+            events.racer_id.write({"start_time": event_time})
+
+    def _apply_start_revert(self) -> None:
+        self.racer_id.write({"start_time": False, "finish_time": False})
+
+    def _apply_finish(self) -> None:
+        for event_time, events in self._group_by_time():
+            events.racer_id.write({"finish_time": event_time})
+        logs = self.finish_log_id
+        if logs:
+            logs.write({"assigned": True, "assigned_time": fields.Datetime.now()})
+
+    def _apply_finish_revert(self) -> None:
+        self.racer_id.write({"finish_time": False})
+
+    def _apply_set_times(self) -> None:
+        for event in self:
+            event.racer_id.write({
+                "start_time": event.start_time or False,
+                "finish_time": event.finish_time or False,
+            })
+
+    def _apply_pause_start(self) -> None:
+        self.env["salezrace.pause.log"].create([{
+            "racer_id": event.racer_id.id,
+            "checkpoint_id": event.checkpoint_id.id,
+            "start_time": event.event_time,
+            "user_id": event.user_id.id,
+        } for event in self])
+
+    def _apply_pause_end(self) -> None:
+        for event_time, events in self._group_by_time():
+            events.racer_id.active_pause_log_id.write({"end_time": event_time})
+
+    def _apply_pause_revert(self) -> None:
+        self.racer_id.active_pause_log_id.unlink()
+
+    def _apply_pause_invalidate(self) -> None:
+        self._checkpoint_pause_logs().write({"is_invalid": True})
+
+    def _apply_custom_time(self) -> None:
+        self._checkpoint_pause_logs().write({"is_invalid": True})
+        self.env["salezrace.pause.log"].create([{
+            "racer_id": event.racer_id.id,
+            "checkpoint_id": event.checkpoint_id.id,
+            "start_time": event.event_time,
+            "end_time": event.event_time + timedelta(seconds=event.duration),
+            "user_id": event.user_id.id,
+            "is_custom": True,
+        } for event in self])
+
+    def _group_by_time(self):
+        """Yield ``(event_time, events)`` so each distinct time is one write."""
+        groups = defaultdict(list)
+        for event in self:
+            groups[event.event_time].append(event.id)
+        for event_time, ids in groups.items():
+            yield event_time, self.browse(ids)
+
+    def _checkpoint_pause_logs(self):
+        """Return the existing pause logs matching these events' (racer, checkpoint) pairs."""
+        pairs = {(event.racer_id.id, event.checkpoint_id.id) for event in self}
+        logs = self.env["salezrace.pause.log"].search([
+            ("racer_id", "in", self.racer_id.ids),
+            ("checkpoint_id", "in", self.checkpoint_id.ids),
+        ])
+        return logs.filtered(lambda log: (log.racer_id.id, log.checkpoint_id.id) in pairs)
+
+    # -----------------------
+    # Rebuild
+    # -----------------------
+    @api.model
+    def _rebuild_racers(self, racers) -> None:
+        """Reset the timing state of ``racers`` and replay their journal.
+
+        Racers whose journal does not record their start (e.g. started before
+        the journal existed) cannot be rebuilt and are left untouched.
+        """
+        events = self.search([("racer_id", "in", racers.ids)], order="id")
+        racers = events.filtered(
+            lambda event: event.event_type == "start" or (event.event_type == "set_times" and event.start_time)
+        ).racer_id
+        events = events.filtered(lambda event: event.racer_id in racers)
+        if not racers:
+            return
+        racers.pause_log_ids.unlink()
+        racers.write({"start_time": False, "finish_time": False})
+        events._materialize()
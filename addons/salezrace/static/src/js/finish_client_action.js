@@ -4,6 +4,8 @@ import { registry } from "@web/core/registry";
 import { useService } from "@web/core/utils/hooks";
 import { Component, useState, onWillStart, onMounted, onWillUnmount } from "@odoo/owl";
 import { ConfirmationDialog } from "@web/core/confirmation_dialog/confirmation_dialog";
+import { useRaceEvents } from "./race_bus";
+import { TimingEventQueue, toServerDatetime } from "./offline_queue";
 
 export class FinishClientAction extends Component {
     static template = "salezrace.FinishClientAction";
@@ -18,35 +20,46 @@ export class FinishClientAction extends Component {
             onTrack: [],
             finishers: [],
             loading: false,
+            pendingEvents: 0,
         });
 
         // internals
-        this._timer = null;
+        this._syncToken = null;
+        // finishes are queued on the device first, so they survive Wi-Fi drops
+        this.queue = new TimingEventQueue(this.orm);
         this._refreshInFlight = false;
         this._refreshRequested = false;
 
         // bind methods
         this.refreshBoth = this.refreshBoth.bind(this);
         this.refreshBothSafe = this.refreshBothSafe.bind(this);
-        this.fetchOnTrack = this.fetchOnTrack.bind(this);
-        this.fetchFinishers = this.fetchFinishers.bind(this);
+        this.fetchDelta = this.fetchDelta.bind(this);
+        this.onRaceEvent = this.onRaceEvent.bind(this);
         this.onFinishNow = this.onFinishNow.bind(this);
+        this.replayQueue = this.replayQueue.bind(this);
         this.formatDuration = this.formatDuration.bind(this);
         
         // Initial load before first render
         onWillStart(this.refreshBothSafe);
 
-        // Start simple 2s polling after mount (no bus, no heuristics)
+        // Racer changes are pushed on the bus; poll only while it is disconnected
+        useRaceEvents(this.onRaceEvent, this.refreshBothSafe);
+
+        // Replay events recorded offline (also those left from a previous session)
         onMounted(() => {
-            this._timer = setInterval(this.refreshBothSafe, 2000);
+            this.replayQueue();
+            this._replayTimer = setInterval(this.replayQueue, 5000);
         });
+        onWillUnmount(() => clearInterval(this._replayTimer));
+    }
 
-        // Cleanup
-        onWillUnmount(() => {
-            if (this._timer) {
-                clearInterval(this._timer);
-                this._timer = null;
-            }
+    // Patch the lists in place from the racer rows carried by a race event
+    onRaceEvent(payload) {
+        const racers = payload.racers || [];
+        this.applyRows({
+            on_track: racers.filter((r) => r.start_time && !r.finish_time),
+            finishers: racers.filter((r) => r.start_time && r.finish_time),
+            removed_ids: racers.filter((r) => !r.start_time).map((r) => r.id),
         });
     }
 
@@ -57,7 +70,7 @@ export class FinishClientAction extends Component {
         }
         this._refreshInFlight = true;
         try {
-            await Promise.all([this.fetchOnTrack(), this.fetchFinishers()]);
+            await this.fetchDelta();
         } finally {
             this._refreshInFlight = false;
             if (this._refreshRequested) {
@@ -78,10 +91,7 @@ export class FinishClientAction extends Component {
             body: `Remove finish time for racer #${row.racer_no}?`,
             confirm: async () => {
                 try {
-                    await this.orm.write("salezrace.racer", [row.id], {
-                        finish_time: false,
-                        final_time: false,
-                    });
+                    await this.orm.call("salezrace.racer", "action_revert_finish", [row.id], {});
                     await this.refreshBothSafe();
                 } catch (e) {
                     this.notification.add(e?.message || "Failed to revert finish.", { type: "danger" });
@@ -90,24 +100,41 @@ export class FinishClientAction extends Component {
         });
     }
     
-    async fetchOnTrack() {
-        const rows = await this.orm.searchRead(
+    // Apply only the rows changed since the last sync token
+    async fetchDelta() {
+        const sentAt = Date.now();
+        const delta = await this.orm.call(
             "salezrace.racer",
-            [["start_time", "!=", false], ["finish_time", "=", false]],
-            ["id", "racer_no", "first_name", "last_name", "age", "gender", "start_time"],
-            { order: "start_time asc, id asc" }
+            "get_finish_board_delta",
+            [this._syncToken],
         );
-        this.state.onTrack = rows;
+        this.queue.setServerTime(delta.server_time_ms, sentAt, Date.now());
+        this.applyRows(delta);
+
+        // Deleted racers leave no trace in a delta: resync when the sizes drift.
+        const inSync =
+            this.state.onTrack.length === delta.counts.on_track &&
+            this.state.finishers.length === delta.counts.finishers;
+        this._syncToken = inSync ? delta.token : null;
     }
 
-    async fetchFinishers() {
-        const rows = await this.orm.searchRead(
-            "salezrace.racer",
-            [["start_time", "!=", false], ["finish_time", "!=", false]],
-            ["id", "racer_no", "first_name", "last_name", "age", "gender", "start_time", "finish_time", "final_time"],
-            { order: "finish_time desc, id desc" }
-        );
-        this.state.finishers = rows;
+    // Merge changed rows into the local lists (or replace them on reset)
+    applyRows({ on_track, finishers, removed_ids, reset = false }) {
+        let onTrack = on_track;
+        let finished = finishers;
+        if (!reset) {
+            const changedIds = new Set([
+                ...removed_ids,
+                ...on_track.map((r) => r.id),
+                ...finishers.map((r) => r.id),
+            ]);
+            onTrack = this.state.onTrack.filter((r) => !changedIds.has(r.id)).concat(onTrack);
+            finished = this.state.finishers.filter((r) => !changedIds.has(r.id)).concat(finished);
+        }
+        onTrack.sort((a, b) => (a.start_time < b.start_time ? -1 : a.start_time > b.start_time ? 1 : a.id - b.id));
+        finished.sort((a, b) => (a.finish_time > b.finish_time ? -1 : a.finish_time < b.finish_time ? 1 : b.id - a.id));
+        this.state.onTrack = onTrack;
+        this.state.finishers = finished;
     }
 
     // Client-side fallback (mm:ss) if server didn't compute final_time
@@ -120,11 +147,31 @@ export class FinishClientAction extends Component {
     }
 
     async onFinishNow(row) {
+        // The finish time is the button press (on server clock), even if sent later
+        const event = await this.queue.record("finish", row.id);
+        this.applyRows({
+            on_track: [],
+            finishers: [{ ...row, finish_time: toServerDatetime(event.time_ms), final_time: false }],
+            removed_ids: [],
+        });
+        await this.replayQueue();
+    }
+
+    async replayQueue() {
+        let results = [];
         try {
-            await this.orm.call("salezrace.racer", "action_finish_now", [row.id], {});
-            await this.refreshBothSafe(); // immediate feedback
+            results = await this.queue.flush();
         } catch (e) {
-            this.notification.add(e?.message || "Failed to finish racer.", { type: "danger" });
+            this.notification.add(e?.message || "Failed to sync finish times.", { type: "danger" });
+        }
+        for (const res of results) {
+            if (res.status === "rejected") {
+                this.notification.add(res.message || "Failed to finish racer.", { type: "danger" });
+            }
+        }
+        this.state.pendingEvents = (await this.queue.pending()).length;
+        if (results.length) {
+            await this.refreshBothSafe(); // immediate feedback
         }
     }
 }
@@ -0,0 +1,132 @@
+/** @odoo-module **/
+
+import { ConnectionLostError } from "@web/core/network/rpc_service";
+
+const DB_NAME = "salezrace_offline";
+const STORE = "timing_events";
+const REPLAY_BATCH_SIZE = 50;
+
+function openDb() {
+    return new Promise((resolve, reject) => {
+        const request = indexedDB.open(DB_NAME, 1);
+        request.onupgradeneeded = () => request.result.createObjectStore(STORE, { keyPath: "uuid" });
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+// Run `callback(store)` in one IndexedDB transaction; resolves with its request result
+async function withStore(mode, callback) {
+    const db = await openDb();
+    try {
+        return await new Promise((resolve, reject) => {
+            const tx = db.transaction(STORE, mode);
+            const request = callback(tx.objectStore(STORE));
+            tx.oncomplete = () => resolve(request && request.result);
+            tx.onerror = () => reject(tx.error);
+            tx.onabort = () => reject(tx.error);
+        });
+    } finally {
+        db.close();
+    }
+}
+
+function newUuid() {
+    if (crypto.randomUUID) {
+        return crypto.randomUUID();
+    }
+    return "10000000-1000-4000-8000-100000000000".replace(/[018]/g, (c) =>
+        (c ^ (crypto.getRandomValues(new Uint8Array(1))[0] & (15 >> (c / 4)))).toString(16)
+    );
+}
+
+/**
+ * Device-local queue of timing events (finish, pause start/end, ...).
+ *
+ * Events are stored in IndexedDB with a uuid and the button-press time on the
+ * server clock, then replayed in batches through the idempotent
+ * `salezrace.racer.action_replay_timing_events` endpoint. Events stay queued
+ * while the server is unreachable and survive page reloads.
+ */
+export class TimingEventQueue {
+    constructor(orm) {
+        this.orm = orm;
+        this.clockOffset = 0;
+        this.online = true;
+        this._seq = 0;
+        this._flushing = null;
+    }
+
+    // Server clock offset from a response carrying server_time_ms (symmetric round trip)
+    setServerTime(serverTimeMs, sentAt, receivedAt) {
+        this.clockOffset = serverTimeMs - (sentAt + receivedAt) / 2;
+    }
+
+    now() {
+        return Date.now() + this.clockOffset;
+    }
+
+    async record(type, racerId, extra = {}) {
+        const event = {
+            uuid: newUuid(),
+            type,
+            racer_id: racerId,
+            time_ms: Math.round(this.now()),
+            seq: Date.now() * 1000 + (this._seq++ % 1000),
+            ...extra,
+        };
+        await withStore("readwrite", (store) => store.put(event));
+        return event;
+    }
+
+    async pending() {
+        const events = (await withStore("readonly", (store) => store.getAll())) || [];
+        return events.sort((a, b) => a.seq - b.seq);
+    }
+
+    // Replay queued events; resolves with the server results of the events it sent
+    flush() {
+        if (!this._flushing) {
+            this._flushing = this._flush().finally(() => {
+                this._flushing = null;
+            });
+        }
+        return this._flushing;
+    }
+
+    async _flush() {
+        const results = [];
+        const events = await this.pending();
+        for (let i = 0; i < events.length; i += REPLAY_BATCH_SIZE) {
+            const batch = events.slice(i, i + REPLAY_BATCH_SIZE);
+            let batchResults;
+            try {
+                // silent: no "connection lost" popup for every retry while offline
+                batchResults = await this.orm.silent.call(
+                    "salezrace.racer",
+                    "action_replay_timing_events",
+                    [batch]
+                );
+            } catch (e) {
+                if (e instanceof ConnectionLostError) {
+                    this.online = false;
+                    break;
+                }
+                throw e;
+            }
+            this.online = true;
+            await withStore("readwrite", (store) => {
+                for (const result of batchResults) {
+                    store.delete(result.uuid);
+                }
+            });
+            results.push(...batchResults);
+        }
+        return results;
+    }
+}
+
+// Odoo datetime string (UTC) for an epoch in milliseconds
+export function toServerDatetime(ms) {
+    return new Date(ms).toISOString().slice(0, 19).replace("T", " ");
+}
@@ -4,6 +4,8 @@ import { registry } from "@web/core/registry";
 import { useService } from "@web/core/utils/hooks";
 import { Component, useState, onWillStart, onMounted, onWillUnmount } from "@odoo/owl";
 import { session } from "@web/session";
+import { useRaceEvents } from "./race_bus";
+import { TimingEventQueue } from "./offline_queue";
 
 export class PauseClientAction extends Component {
     static template = "salezrace.PauseClientAction";
@@ -19,9 +21,12 @@ export class PauseClientAction extends Component {
             loading: false,
             livePause: {},
             session: session,
+            pendingEvents: 0,
         });
 
         this.timer = null;
+        // pause actions are queued on the device first, so they survive Wi-Fi drops
+        this.queue = new TimingEventQueue(this.orm);
         this._refreshInFlight = false;
         this._refreshRequested = false;
 
@@ -35,16 +40,21 @@ export class PauseClientAction extends Component {
         this.onCustomTime = this.onCustomTime.bind(this);
         this.onConfirmCustomTime = this.onConfirmCustomTime.bind(this);
         this.onCancelCustomTime = this.onCancelCustomTime.bind(this);
+        this.replayQueue = this.replayQueue.bind(this);
 
         onWillStart(() => this.loadCheckpoints());
         onMounted(() => {
             this.timer = setInterval(() => this._updateLiveTimes(), 1000);
-            this.refreshTimer = setInterval(() => this.refreshSafe(), 5000);
+            // Replay events recorded offline (also those left from a previous session)
+            this.replayQueue();
+            this._replayTimer = setInterval(this.replayQueue, 5000);
         });
         onWillUnmount(() => {
             clearInterval(this.timer);
-            clearInterval(this.refreshTimer);
+            clearInterval(this._replayTimer);
         });
+        // Any start/finish/pause change can affect this board; the bus tells us when
+        useRaceEvents(() => this.refreshSafe(), this.refreshSafe);
     }
 
     async loadCheckpoints() {
@@ -92,75 +102,60 @@ export class PauseClientAction extends Component {
         if (!this.state.selectedCheckpoint) {
             return;
         }
-        try {
-            const onTrack = await this.orm.searchRead(
-                "salezrace.racer",
-                [["start_time", "!=", false], ["finish_time", "=", false]],
-                ["id", "racer_no", "first_name", "last_name", "active_pause_log_id", "active_pause_checkpoint_name", "active_pause_user_id"],
-                { order: "start_time asc, id asc" }
-            );
-
-            const racer_ids = onTrack.map(racer => racer.id);
-            const pause_logs = await this.orm.searchRead(
-                "salezrace.pause.log",
-                [["racer_id", "in", racer_ids], ["checkpoint_id", "=", this.state.selectedCheckpoint.id], ["is_invalid", "=", false]],
-                ["racer_id", "start_time", "end_time"]
-            );
-
-            for (const racer of onTrack) {
-                const existing_racer = this.state.onTrack.find(r => r.id === racer.id);
-                const racer_pause_logs = pause_logs.filter(log => log.racer_id[0] === racer.id);
-                let checkpoint_pause_time = 0;
-                for (const log of racer_pause_logs) {
-                    if (log.start_time && log.end_time) {
-                        const start = new Date(log.start_time + "Z");
-                        const end = new Date(log.end_time + "Z");
-                        const duration = (end - start) / 1000;
-                        checkpoint_pause_time += duration;
-                    }
-                }
-                if (existing_racer) {
-                    existing_racer.checkpoint_pause_time = checkpoint_pause_time;
-                    existing_racer.active_pause_log_id = racer.active_pause_log_id;
-                    existing_racer.active_pause_checkpoint_name = racer.active_pause_checkpoint_name;
-                    existing_racer.active_pause_user_id = racer.active_pause_user_id;
-                } else {
-                    this.state.onTrack.push({ ...racer, checkpoint_pause_time: checkpoint_pause_time, live_pause_time: 0, showCustomTimeInput: false, custom_time: 0 });
-                }
+        const checkpointId = this.state.selectedCheckpoint.id;
+        const sentAt = Date.now();
+        const board = await this.orm.call("salezrace.racer", "get_pause_board", [checkpointId]);
+        this.queue.setServerTime(board.server_time_ms, sentAt, Date.now());
+
+        const livePause = {};
+        const onTrack = board.racers.map((racer) => {
+            const existing_racer = this.state.onTrack.find((r) => r.id === racer.id);
+            if (racer.active_pause_log_id && racer.active_pause_checkpoint_id === checkpointId) {
+                livePause[racer.id] = { startTime: Date.parse(racer.active_pause_start_time.replace(" ", "T") + "Z") };
             }
-            this.state.onTrack = this.state.onTrack.filter(racer => onTrack.some(r => r.id === racer.id));
+            return {
+                live_pause_time: 0,
+                showCustomTimeInput: false,
+                custom_time: 0,
+                ...(existing_racer || {}),
+                ...racer,
+            };
+        });
+        this.state.livePause = livePause;
+        this.state.onTrack = onTrack;
+        this._updateLiveTimes();
+    }
 
-        } finally {
-        }
+    _now() {
+        return this.queue.now();
     }
 
     _updateLiveTimes() {
-        for (const racerId in this.state.livePause) {
-            const pause = this.state.livePause[racerId];
-            const liveTime = (new Date() - pause.startTime) / 1000;
-            const racer = this.state.onTrack.find(r => r.id == racerId);
-            if (racer) {
-                racer.live_pause_time = liveTime;
-            }
+        for (const racer of this.state.onTrack) {
+            const pause = this.state.livePause[racer.id];
+            racer.live_pause_time = pause ? Math.max(0, (this._now() - pause.startTime) / 1000) : 0;
         }
     }
 
     async onPauseStart(racer) {
-        this.state.livePause[racer.id] = { startTime: new Date() };
-        await this.handlePauseAction("action_pause_start", racer);
+        this.state.livePause[racer.id] = { startTime: this._now() };
+        racer.active_pause_log_id = true;
+        racer.active_pause_user_id = session.uid;
+        await this.handlePauseAction("pause_start", racer);
     }
 
     async onPauseEnd(racer) {
         racer.live_pause_time = 0;
         delete this.state.livePause[racer.id];
-        await this.handlePauseAction("action_pause_end", racer);
+        racer.active_pause_log_id = false;
+        await this.handlePauseAction("pause_end", racer);
     }
 
     async onPauseInvalidate(racer) {
         if (racer.active_pause_log_id) {
             await this.onPauseEnd(racer);
         }
-        await this.handlePauseAction("action_invalidate_logs", racer);
+        await this.handlePauseAction("pause_invalidate", racer);
     }
 
     onCustomTime(racer) {
@@ -173,32 +168,36 @@ export class PauseClientAction extends Component {
     }
 
     async onConfirmCustomTime(racer) {
-        await this.orm.call(
-            "salezrace.racer",
-            "action_custom_time",
-            [racer.id, this.state.selectedCheckpoint.id, parseInt(racer.custom_time)]
-        );
         racer.showCustomTimeInput = false;
-        await this.refresh();
+        await this.handlePauseAction("custom_time", racer, { custom_time: parseInt(racer.custom_time) });
     }
 
-    async handlePauseAction(action, racer) {
+    async handlePauseAction(type, racer, extra = {}) {
         this.state.loading = true;
         try {
-            let args = [racer.id];
-            if (action === 'action_pause_start' || action === 'action_invalidate_logs') {
-                args.push(this.state.selectedCheckpoint.id);
-            }
-            await this.orm.call("salezrace.racer", action, args, {});
-        } catch (e) {
-            const errorMessage = e.data?.message || e.message || `Failed to ${action}.`;
-            this.notification.add(errorMessage, { type: "danger" });
-            if (action === 'action_pause_start') {
-                delete this.state.livePause[racer.id];
-            }
+            // The action time is the button press (on server clock), even if sent later
+            await this.queue.record(type, racer.id, { checkpoint_id: this.state.selectedCheckpoint.id, ...extra });
+            await this.replayQueue();
         } finally {
             this.state.loading = false;
-            await this.refresh();
+        }
+    }
+
+    async replayQueue() {
+        let results = [];
+        try {
+            results = await this.queue.flush();
+        } catch (e) {
+            this.notification.add(e.data?.message || e.message || "Failed to sync pause actions.", { type: "danger" });
+        }
+        for (const res of results) {
+            if (res.status === "rejected") {
+                this.notification.add(res.message || "Failed to record pause action.", { type: "danger" });
+            }
+        }
+        this.state.pendingEvents = (await this.queue.pending()).length;
+        if (results.length && this.queue.online) {
+            await this.refreshSafe();
         }
     }
 }
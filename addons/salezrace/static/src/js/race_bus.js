@@ -0,0 +1,48 @@
+/** @odoo-module **/
+
+import { useService } from "@web/core/utils/hooks";
+import { onMounted, onWillUnmount } from "@odoo/owl";
+
+export const RACE_BUS_EVENT = "salezrace/race_event";
+
+/**
+ * Subscribe a client action to race events pushed on the bus.
+ *
+ * The server adds the race channel to the websocket subscription of timing
+ * staff (see ir.websocket in salezrace), so the client only listens.
+ *
+ * `onEvent(payload)` is called for every race event. `onPoll()` is the
+ * fallback refresh: it runs every `pollInterval` ms only while the bus is
+ * disconnected, and once right after it reconnects to catch up on missed events.
+ */
+export function useRaceEvents(onEvent, onPoll, pollInterval = 15000) {
+    const busService = useService("bus_service");
+    let connected = true;
+    let timer = null;
+
+    const onDisconnect = () => {
+        connected = false;
+    };
+    const onReconnect = () => {
+        connected = true;
+        onPoll();
+    };
+
+    onMounted(() => {
+        busService.subscribe(RACE_BUS_EVENT, onEvent);
+        busService.addEventListener("disconnect", onDisconnect);
+        busService.addEventListener("reconnect", onReconnect);
+        timer = setInterval(() => {
+            if (!connected) {
+                onPoll();
+            }
+        }, pollInterval);
+    });
+
+    onWillUnmount(() => {
+        clearInterval(timer);
+        busService.unsubscribe(RACE_BUS_EVENT, onEvent);
+        busService.removeEventListener("disconnect", onDisconnect);
+        busService.removeEventListener("reconnect", onReconnect);
+    });
+}
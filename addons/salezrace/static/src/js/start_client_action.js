@@ -4,6 +4,7 @@ import { registry } from "@web/core/registry";
 import { useService } from "@web/core/utils/hooks";
 import { Component, useState, onWillStart } from "@odoo/owl";
 import { ConfirmationDialog } from "@web/core/confirmation_dialog/confirmation_dialog";
+import { useRaceEvents } from "./race_bus";
 
 export class StartClientAction extends Component {
     static template = "salezrace.StartClientAction";
@@ -21,6 +22,10 @@ export class StartClientAction extends Component {
             // additions from the second file:
             recentStarted: [],
             nextToStart: [],
+            // wave mode: start many racers at one shared timestamp
+            waveMode: false,
+            waveInput: "",
+            waveResults: [],
         });
 
         this._debounceTimer = null;
@@ -29,6 +34,21 @@ export class StartClientAction extends Component {
         onWillStart(async () => {
             await this.fetchLists();
         });
+
+        // Starts from other tablets are pushed on the bus
+        useRaceEvents((payload) => this.onRaceEvent(payload), () => this.fetchLists());
+    }
+
+    onRaceEvent(payload) {
+        if (!["racer_started", "start_reverted"].includes(payload.event)) {
+            return;
+        }
+        const current = this.state.racer;
+        const row = current && (payload.racers || []).find((r) => r.id === current.id);
+        if (row) {
+            current.start_time = row.start_time;
+        }
+        this.fetchLists();
     }
 
     // ---------- Derived ----------
@@ -76,12 +96,8 @@ export class StartClientAction extends Component {
         }
         this.state.loading = true;
         try {
-            // upgraded fields from the second file (include id + racer_no)
-            const res = await this.orm.searchRead(
-                "salezrace.racer",
-                [["racer_no", "=", noVal]],
-                ["id", "first_name", "last_name", "age", "gender", "category", "racer_no", "start_time"]
-            );
+            // indexed exact-number lookup, compact record in one round trip
+            const res = await this.orm.call("salezrace.racer", "lookup_racer", [noVal]);
             this.state.racer = res.length ? res[0] : null;
             if (!this.state.racer) {
                 this.state.error = "Racer not found.";
@@ -105,6 +121,45 @@ export class StartClientAction extends Component {
         }
     }
 
+    // ---------- Wave mode ----------
+    toggleWaveMode() {
+        this.state.waveMode = !this.state.waveMode;
+        this.state.waveResults = [];
+    }
+
+    onWaveInput(ev) {
+        this.state.waveInput = ev.target.value;
+    }
+
+    get waveNumbers() {
+        return this.state.waveInput
+            .split(/[\s,;]+/)
+            .filter((tok) => tok)
+            .map((tok) => parseInt(tok, 10) || 0);
+    }
+
+    async onClickStartWave() {
+        const numbers = this.waveNumbers;
+        if (!numbers.length) return;
+        this.state.loading = true;
+        try {
+            const results = await this.orm.call("salezrace.racer", "action_start_wave", [numbers], {});
+            this.state.waveResults = results;
+            const started = results.filter((r) => r.status === "started").length;
+            this.notification.add(`${started} of ${results.length} racers started.`, {
+                type: started === results.length ? "success" : "warning",
+            });
+            if (started === results.length) {
+                this.state.waveInput = "";
+            }
+            await this.fetchLists();
+        } catch (e) {
+            this.notification.add(e?.message || "Cannot start wave.", { type: "danger" });
+        } finally {
+            this.state.loading = false;
+        }
+    }
+
     // new: Revert action for the left summary table
     onClickRevert(row) {
         this.dialog.add(ConfirmationDialog, {
@@ -112,7 +167,7 @@ export class StartClientAction extends Component {
             body: `Remove start time for racer #${row.racer_no} ${row.first_name} ${row.last_name}?`,
             confirm: async () => {
                 try {
-                    await this.orm.write("salezrace.racer", [row.id], { start_time: false, finish_time: false });
+                    await this.orm.call("salezrace.racer", "action_revert_start", [row.id], {});
                     if (this.state.racer && this.state.racer.id === row.id) {
                         this.state.racer.start_time = false;
                     }
@@ -0,0 +1,3 @@
+from . import test_racer_numbers
+from . import test_results
+from . import test_timing_replay
@@ -0,0 +1,54 @@
+import psycopg2
+
+from odoo import SUPERUSER_ID, api
+from odoo.tests import TransactionCase, tagged
+from odoo.tools import mute_logger
+
+
+@tagged("post_install", "-at_install")
+class TestRacerNumbers(TransactionCase):
+    def _racer_vals(self, **vals):
+        return {"first_name": "Peter", "last_name": "Novák", "age": 25, "gender": "male", **vals}
+
+    def test_allocate_append(self):
+        racers = self.env["salezrace.racer"].create([self._racer_vals(), self._racer_vals()])
+        self.env.cr.execute("SELECT COALESCE(MAX(racer_no), 0) FROM salezrace_racer")
+        max_no = self.env.cr.fetchone()[0]
+        assigned = racers._allocate_racer_numbers()
+        self.assertEqual(sorted(assigned.values()), [max_no + 1, max_no + 2])
+        self.assertEqual(sorted(racers.mapped("racer_no")), [max_no + 1, max_no + 2])
+
+    def test_allocate_conflict_is_retryable(self):
+        racer = self.env["salezrace.racer"].create(self._racer_vals())
+        # Fix this transaction's snapshot before another desk commits a number.
+        self.env.cr.execute("SELECT COALESCE(MAX(racer_no), 0) FROM salezrace_racer")
+        next_no = self.env.cr.fetchone()[0] + 1
+        with self.registry.cursor() as other_cr:
+            other = api.Environment(other_cr, SUPERUSER_ID, {})["salezrace.racer"].create(
+                self._racer_vals(racer_no=next_no)
+            )
+            other_id = other.id
+        self.addCleanup(self._delete_committed_racer, other_id)
+
+        with mute_logger("odoo.sql_db"), self.assertRaises(psycopg2.errors.SerializationFailure) as caught:
+            racer._allocate_racer_numbers()
+        # Only server-raised concurrency errors are retried by Odoo.
+        self.assertEqual(caught.exception.pgcode, "40001")
+
+    def _delete_committed_racer(self, racer_id):
+        with self.registry.cursor() as cr:
+            cr.execute("DELETE FROM salezrace_racer WHERE id = %s", [racer_id])
+
+    def test_name_search_number_is_exact(self):
+        Racer = self.env["salezrace.racer"]
+        self.env.cr.execute("SELECT COALESCE(MAX(racer_no), 0) FROM salezrace_racer")
+        base = self.env.cr.fetchone()[0] + 1000
+        exact, longer, aged = Racer.create([
+            self._racer_vals(racer_no=base + 12),
+            self._racer_vals(racer_no=(base + 12) * 10),
+            self._racer_vals(age=base + 12),
+        ])
+        ids = [racer_id for racer_id, _name in Racer.name_search(str(base + 12))]
+        self.assertEqual(ids, [exact.id])
+        self.assertNotIn(longer.id, ids)
+        self.assertNotIn(aged.id, ids)
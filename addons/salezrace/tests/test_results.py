@@ -0,0 +1,27 @@
+from unittest.mock import patch
+
+from odoo.tests import TransactionCase, tagged
+
+from ..models.result import RESULT_REFRESH_LOCK_KEY, refresh_results
+
+
+@tagged("post_install", "-at_install")
+class TestResultsRefresh(TransactionCase):
+    def _patch_refresh(self):
+        return patch.object(type(self.env["salezrace.result"]), "_refresh", autospec=True)
+
+    def test_refresh_skips_current_snapshot(self):
+        refresh_results(self.registry)
+        with self._patch_refresh() as rebuild:
+            refresh_results(self.registry)
+        rebuild.assert_not_called()
+
+    def test_refresh_skips_while_another_worker_rebuilds(self):
+        with self.registry.cursor() as cr:
+            cr.execute("SELECT nextval('salezrace_race_version_seq')")
+            cr.commit()
+            cr.execute("SELECT pg_advisory_xact_lock(%s)", [RESULT_REFRESH_LOCK_KEY])
+            with self._patch_refresh() as rebuild:
+                refresh_results(self.registry)
+            rebuild.assert_not_called()
+        refresh_results(self.registry)
@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from odoo import fields
+from odoo.tests import TransactionCase, tagged
+from odoo.tools import mute_logger
+
+
+@tagged("post_install", "-at_install")
+class TestTimingReplay(TransactionCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Racer = cls.env["salezrace.racer"]
+        cls.checkpoint = cls.env.ref("salezrace.salezrace_checkpoint_1")
+        cls.start = fields.Datetime.now().replace(microsecond=0) - timedelta(hours=1)
+        cls.racer = cls.Racer.create({"first_name": "Jana", "last_name": "Kováčová", "age": 30, "gender": "female"})
+        cls.racer._record_timing_event("start", event_time=cls.start)
+
+    def _event(self, event_type, minutes, **vals):
+        """A replayed event ``minutes`` after the racer's start."""
+        time_ms = (self.start + timedelta(minutes=minutes) - datetime(1970, 1, 1)).total_seconds() * 1000
+        return {"uuid": str(uuid4()), "type": event_type, "racer_id": self.racer.id, "time_ms": time_ms, **vals}
+
+    def _replay(self, *events):
+        return [result["status"] for result in self.Racer.action_replay_timing_events(list(events))]
+
+    def test_replay_finish(self):
+        event = self._event("finish", 30)
+        self.assertEqual(self._replay(event), ["applied"])
+        self.assertEqual(self.racer.finish_time, self.start + timedelta(minutes=30))
+        self.assertEqual(self._replay(event), ["duplicate"])
+
+    def test_replay_rejects_finish_before_start(self):
+        self.assertEqual(self._replay(self._event("finish", -5)), ["rejected"])
+        self.assertFalse(self.racer.finish_time)
+
+    def test_replay_rejects_pause_end_before_pause_start(self):
+        pause_start = self._event("pause_start", 10, checkpoint_id=self.checkpoint.id)
+        self.assertEqual(self._replay(pause_start), ["applied"])
+        self.assertEqual(self._replay(self._event("pause_end", 5)), ["rejected"])
+        self.assertTrue(self.racer.active_pause_log_id)
+        self.assertEqual(self._replay(self._event("pause_end", 12)), ["applied"])
+        self.assertFalse(self.racer.active_pause_log_id)
+
+    @mute_logger("odoo.sql_db")
+    def test_replay_batch_continues_after_rejected_event(self):
+        bad_checkpoint = self._event("pause_start", 10, checkpoint_id=-1)
+        finish = self._event("finish", 30)
+        # A foreign key violation is rejected, not mistaken for a duplicate.
+        self.assertEqual(self._replay(bad_checkpoint, finish), ["rejected", "applied"])
+        self.assertFalse(self.racer.pause_log_ids)
+        self.assertTrue(self.racer.finish_time)
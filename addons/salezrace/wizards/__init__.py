@@ -1 +1,2 @@
-from . import racer_time_wizard
\ No newline at end of file
+from . import racer_time_wizard
+from . import racer_import_wizard
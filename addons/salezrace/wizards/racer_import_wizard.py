@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import base64
+import csv
+import io
+from typing import Iterator, List, Tuple
+
+from odoo import fields, models, _
+from odoo.exceptions import UserError
+
+
+# Accepted column headers (normalized: lower case, "_" -> " ") and their fields.
+IMPORT_COLUMNS = {
+    "first name": "first_name",
+    "last name": "last_name",
+    "age": "age",
+    "gender": "gender",
+    "email": "email",
+    "racer no": "racer_no",
+}
+REQUIRED_COLUMNS = ("first_name", "last_name", "age", "gender")
+# CSV encodings tried in order; Excel on Slovak Windows saves cp1250.
+CSV_ENCODINGS = ("utf-8-sig", "cp1250")
+
+
+class SalezRaceRacerImportWizard(models.TransientModel):
+    _name = "salezrace.racer.import.wizard"
+    _description = "Import Racers"
+
+    file = fields.Binary(string="File", required=True)
+    filename = fields.Char()
+    assign_numbers = fields.Selection(
+        selection=[
+            ("none", "Do not assign"),
+            ("append", "Next free numbers"),
+            ("fill_gaps", "Fill gaps"),
+        ],
+        string="Racer Numbers",
+        default="none",
+        required=True,
+    )
+    state = fields.Selection([("draft", "Draft"), ("done", "Done")], default="draft")
+    imported_count = fields.Integer(string="Imported", readonly=True)
+    error_count = fields.Integer(string="Rejected", readonly=True)
+    error_log = fields.Text(string="Errors", readonly=True)
+
+    def action_import(self):
+        """Import the uploaded CSV/XLSX file and show the per-row report."""
+        self.ensure_one()
+        assign = self.assign_numbers if self.assign_numbers != "none" else False
+        result = self.env["salezrace.racer"]._import_racers(self._iter_rows(), assign_numbers=assign)
+        errors = result["errors"]
+        self.write({
+            "state": "done",
+            "imported_count": len(result["created"]),
+            "error_count": len(errors),
+            "error_log": "\n".join(_("Line %(line)s: %(error)s", line=line, error=error) for line, error in errors),
+        })
+        return {
+            "type": "ir.actions.act_window",
+            "name": _("Import Racers"),
+            "res_model": self._name,
+            "res_id": self.id,
+            "view_mode": "form",
+            "target": "new",
+        }
+
+    # -----------------------
+    # File parsing
+    # -----------------------
+    def _iter_rows(self) -> Iterator[Tuple[int, dict]]:
+        """Yield ``(line_no, values)`` for every non-empty data row of the file."""
+        data = base64.b64decode(self.file)
+        if (self.filename or "").lower().endswith(".xlsx"):
+            rows = self._iter_xlsx(data)
+        else:
+            rows = self._iter_csv(data)
+
+        header = next(rows, None)
+        if not header:
+            raise UserError(_("The file is empty."))
+        columns = [IMPORT_COLUMNS.get(str(cell or "").strip().lower().replace("_", " ")) for cell in header]
+        missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+        if missing:
+            raise UserError(_("Missing columns: %s") % ", ".join(missing))
+
+        for line_no, row in enumerate(rows, start=2):
+            if all(cell in (None, "") for cell in row):
+                continue
+            yield line_no, {name: cell for name, cell in zip(columns, row) if name}
+
+    def _iter_csv(self, data: bytes) -> Iterator[List]:
+        for encoding in CSV_ENCODINGS:
+            try:
+                text = io.StringIO(data.decode(encoding), newline="")
+                break
+            except UnicodeDecodeError:
+                continue
+        else:
+            raise UserError(_("The CSV file must be encoded in UTF-8 or Windows-1250."))
+        try:
+            dialect = csv.Sniffer().sniff(text.read(4096), delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        text.seek(0)
+        return csv.reader(text, dialect)
+
+    def _iter_xlsx(self, data: bytes) -> Iterator[List]:
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise UserError(_("Reading XLSX files requires the openpyxl Python package."))
+        workbook = load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+        return (list(row) for row in workbook.active.iter_rows(values_only=True))
@@ -27,10 +27,10 @@ class SalezRaceRacerTimeWizard(models.TransientModel):
     def action_apply(self):
         """Write start/finish times back to the racer."""
         self.ensure_one()
-        racer = self.racer_id
-        vals = {}
-        # Allow manager to set/clear either field
-        vals["start_time"] = self.start_time or False
-        vals["finish_time"] = self.finish_time or False
-        racer.write(vals)
+        # Allow manager to set/clear either field; journaled like any timing action
+        self.racer_id._record_timing_event(
+            "set_times",
+            start_time=self.start_time or False,
+            finish_time=self.finish_time or False,
+        )
         return {"type": "ir.actions.act_window_close"}
@@ -0,0 +1,539 @@
+"""Race-day load test for the salezrace timing screens.
+
+Simulates registration desks and Start, Finish and Pause tablets against a
+running Odoo (e.g. the docker-compose stack) using the same JSON-RPC calls
+as the web client, and reports latency percentiles per call, queries per
+request and database CPU.
+
+Run it against a throwaway database: it creates racers and timing events.
+
+    docker compose up -d
+    python benchmarks/race_day_load.py --db race --login admin --password admin \\
+        --desks 4 --start 2 --finish 2 --pause 6 --duration 120
+
+Queries per request come from ``pg_stat_statements`` (enabled for the ``db``
+service in docker-compose.yml) and need ``psycopg2``; DB CPU is sampled with
+``docker stats``. Either is reported as ``n/a`` when unavailable.
+
+Screens refresh the way the web client does: once per race event pushed on
+the bus (simulated in-process), and every 15 s only with ``--bus-down``.
+"""
+
+import argparse
+import http.cookiejar
+import itertools
+import json
+import queue
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+# Fallback refresh of the screens while the bus is disconnected (race_bus.js)
+FALLBACK_POLL = 15.0
+# Longest a station sleeps before checking whether the run is over
+IDLE_WAIT = 0.5
+
+
+class RpcError(Exception):
+    """An RPC answered with an Odoo error (validation, access, ...)."""
+
+
+class Session:
+    """One logged-in browser tab talking JSON-RPC to the web client routes."""
+
+    def __init__(self, url: str, db: str, login: str, password: str, timeout: float) -> None:
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+        )
+        self._ids = itertools.count(1)
+        result = self._post("/web/session/authenticate", {"db": db, "login": login, "password": password})
+        if not result.get("uid"):
+            raise RpcError(f"Authentication failed for {login!r}")
+        self.uid = result["uid"]
+
+    def _post(self, path: str, params: Dict[str, Any]) -> Any:
+        body = json.dumps({"jsonrpc": "2.0", "method": "call", "id": next(self._ids), "params": params})
+        request = urllib.request.Request(
+            self.url + path, data=body.encode(), headers={"Content-Type": "application/json"}
+        )
+        with self.opener.open(request, timeout=self.timeout) as response:
+            payload = json.loads(response.read())
+        if payload.get("error"):
+            error = payload["error"]
+            raise RpcError(error.get("data", {}).get("message") or error.get("message"))
+        return payload.get("result")
+
+    def call(self, model: str, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Same request as ``orm.call(model, method, args, kwargs)`` in the web client."""
+        return self._post(
+            f"/web/dataset/call_kw/{model}/{method}",
+            {"model": model, "method": method, "args": list(args), "kwargs": kwargs},
+        )
+
+
+class Stats:
+    """Thread-safe latency samples per call name."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.failures: Dict[str, int] = defaultdict(int)
+
+    def timed(self, name: str, func, *args: Any, **kwargs: Any) -> Any:
+        """Run ``func`` and record its latency under ``name``.
+
+        Odoo errors (e.g. two tablets starting the same racer) are counted and
+        return None; transport errors (timeouts, refused connections) as well.
+        """
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except RpcError:
+            with self.lock:
+                self.errors[name] += 1
+        except OSError:
+            with self.lock:
+                self.failures[name] += 1
+        finally:
+            with self.lock:
+                self.latencies[name].append(time.perf_counter() - started)
+        return None
+
+    @property
+    def request_count(self) -> int:
+        return sum(len(samples) for samples in self.latencies.values())
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples``."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+# -----------------------
+# Stations
+# -----------------------
+class RaceBus:
+    """In-process stand-in for the bus: delivers each race event to every subscribed screen."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.inboxes: List[queue.Queue] = []
+
+    def subscribe(self) -> queue.Queue:
+        inbox: queue.Queue = queue.Queue()
+        with self.lock:
+            self.inboxes.append(inbox)
+        return inbox
+
+    def publish(self, event: str, racer_ids: List[int]) -> None:
+        with self.lock:
+            inboxes = list(self.inboxes)
+        for inbox in inboxes:
+            inbox.put({"event": event, "racer_ids": racer_ids})
+
+
+class Station(threading.Thread):
+    """Base class: ``act`` now and then until ``stop`` is set, refreshing like the web client.
+
+    Screens ``refresh`` once when opened, then handle the race events of the
+    bus (``on_events``). With the bus down they get no events and ``refresh``
+    every FALLBACK_POLL seconds instead.
+    """
+
+    screen = True
+
+    def __init__(self, name: str, session: Session, stats: Stats, stop: threading.Event, args, bus: RaceBus) -> None:
+        super().__init__(name=name, daemon=True)
+        self.session = session
+        self.stats = stats
+        self.stop = stop
+        self.args = args
+        self.bus = bus
+        self.inbox = bus.subscribe() if self.screen and not args.bus_down else None
+        self.rng = random.Random(name)
+        self.next_action = time.monotonic() + self.rng.uniform(0, args.action_interval)
+
+    def call(self, model: str, method: str, *args: Any, **kwargs: Any) -> Any:
+        return self.stats.timed(f"{model}.{method}", self.session.call, model, method, *args, **kwargs)
+
+    def call_ok(self, model: str, method: str, *args: Any, **kwargs: Any) -> bool:
+        """Like ``call`` for methods returning nothing; True when the call succeeded."""
+        done = []
+        self.stats.timed(
+            f"{model}.{method}", lambda: done.append(self.session.call(model, method, *args, **kwargs))
+        )
+        return bool(done)
+
+    def run(self) -> None:
+        # tablets are opened at random times
+        self.stop.wait(self.rng.uniform(0, 1))
+        if self.screen:
+            self.refresh()
+        next_poll = time.monotonic() + FALLBACK_POLL
+        while not self.stop.is_set():
+            events = self._wait_for_events(next_poll if self.screen and self.inbox is None else None)
+            if events:
+                self.on_events(events)
+            now = time.monotonic()
+            if self.screen and self.inbox is None and now >= next_poll:
+                self.refresh()
+                next_poll = now + FALLBACK_POLL
+            if now >= self.next_action:
+                self.act()
+                self.next_action = time.monotonic() + self.rng.expovariate(1 / self.args.action_interval)
+
+    def _wait_for_events(self, next_poll: Optional[float]) -> List[dict]:
+        """Sleep until the next action, poll or event; return all events queued meanwhile.
+
+        Events arriving while the screen is busy are handled together, as the
+        client coalesces refreshes requested during one in flight.
+        """
+        deadline = min(self.next_action, next_poll or self.next_action)
+        timeout = min(IDLE_WAIT, max(0.0, deadline - time.monotonic()))
+        if self.inbox is None:
+            self.stop.wait(timeout)
+            return []
+        events = []
+        try:
+            events.append(self.inbox.get(timeout=timeout))
+            while True:
+                events.append(self.inbox.get_nowait())
+        except queue.Empty:
+            pass
+        return events
+
+    def refresh(self) -> None:
+        pass
+
+    def on_events(self, events: List[dict]) -> None:
+        pass
+
+    def act(self) -> None:
+        pass
+
+    def replay(self, events: List[dict]) -> List[dict]:
+        return self.call("salezrace.racer", "action_replay_timing_events", events) or []
+
+    def timing_event(self, event_type: str, racer_id: int, **extra: Any) -> dict:
+        return {
+            "uuid": f"{self.name}-{time.time_ns()}-{self.rng.random()}",
+            "type": event_type,
+            "racer_id": racer_id,
+            "time_ms": int(time.time() * 1000),
+            **extra,
+        }
+
+
+class RegistrationDesk(Station):
+    """Registers walk-in racers: search for duplicates, create, assign a number."""
+
+    screen = False
+
+    def act(self) -> None:
+        last_name = f"Load{self.rng.randrange(100000)}"
+        self.call(
+            "salezrace.racer", "search_read",
+            [["search_key", "ilike", last_name.lower()]], fields=["id", "racer_no", "first_name", "last_name"], limit=80,
+        )
+        racer_id = self.call("salezrace.racer", "create", {
+            "first_name": self.name,
+            "last_name": last_name,
+            "age": self.rng.randint(8, 70),
+            "gender": self.rng.choice(["male", "female"]),
+        })
+        if racer_id:
+            self.call("salezrace.racer", "action_assign_number", [racer_id])
+
+
+class StartScreen(Station):
+    """Start tablet: reloads its two lists on start events and starts the next waiting racers."""
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.waiting: List[dict] = []
+
+    def refresh(self) -> None:
+        self.call(
+            "salezrace.racer", "search_read", [["start_time", "!=", False]],
+            fields=["id", "racer_no", "first_name", "last_name", "start_time"], order="start_time desc", limit=10,
+        )
+        self.waiting = self.call(
+            "salezrace.racer", "search_read", [["start_time", "=", False], ["racer_no", "!=", 0]],
+            fields=["id", "racer_no", "first_name", "last_name"], order="racer_no asc", limit=10,
+        ) or []
+
+    def on_events(self, events: List[dict]) -> None:
+        if any(event["event"] in ("racer_started", "start_reverted") for event in events):
+            self.refresh()
+
+    def act(self) -> None:
+        if not self.waiting:
+            return
+        racer = self.rng.choice(self.waiting)
+        if not self.call("salezrace.racer", "lookup_racer", racer["racer_no"]):
+            return
+        if self.call_ok("salezrace.racer", "action_start", [racer["id"]]):
+            self.bus.publish("racer_started", [racer["id"]])
+        # the client re-reads the racer and its lists after starting
+        self.call("salezrace.racer", "lookup_racer", racer["racer_no"])
+        self.refresh()
+
+
+class FinishScreen(Station):
+    """Finish tablet: patches the board from race events and finishes racers on track."""
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.token: Optional[str] = None
+        self.on_track: Dict[int, dict] = {}
+
+    def refresh(self) -> None:
+        delta = self.call("salezrace.racer", "get_finish_board_delta", self.token)
+        if not delta:
+            return
+        self.token = delta["token"]
+        if delta["reset"]:
+            self.on_track = {}
+        for row in delta["on_track"]:
+            self.on_track[row["id"]] = row
+        for racer_id in [row["id"] for row in delta["finishers"]] + delta["removed_ids"]:
+            self.on_track.pop(racer_id, None)
+
+    def on_events(self, events: List[dict]) -> None:
+        # race events carry the racer rows, so the client patches without an RPC
+        for event in events:
+            for racer_id in event["racer_ids"]:
+                if event["event"] == "racer_started":
+                    self.on_track[racer_id] = {"id": racer_id}
+                elif event["event"] in ("racer_finished", "start_reverted"):
+                    self.on_track.pop(racer_id, None)
+
+    def act(self) -> None:
+        if self.on_track:
+            racer_id = self.rng.choice(list(self.on_track))
+            self.on_track.pop(racer_id)
+            if any(result["status"] == "applied" for result in self.replay([self.timing_event("finish", racer_id)])):
+                self.bus.publish("racer_finished", [racer_id])
+            # the client syncs the board after replaying its queue
+            self.refresh()
+
+
+class PauseScreen(Station):
+    """Pause tablet at one checkpoint: reloads the board on race events, starts and ends pauses."""
+
+    def __init__(self, *args: Any, checkpoint_id: int) -> None:
+        super().__init__(*args)
+        self.checkpoint_id = checkpoint_id
+        self.racers: List[dict] = []
+
+    def refresh(self) -> None:
+        board = self.call("salezrace.racer", "get_pause_board", self.checkpoint_id)
+        self.racers = board["racers"] if board else []
+
+    def on_events(self, events: List[dict]) -> None:
+        self.refresh()
+
+    def act(self) -> None:
+        if not self.racers:
+            return
+        racer = self.rng.choice(self.racers)
+        event_type = "pause_end" if racer.get("active_pause_log_id") else "pause_start"
+        results = self.replay([self.timing_event(event_type, racer["id"], checkpoint_id=self.checkpoint_id)])
+        if any(result["status"] == "applied" for result in results):
+            self.bus.publish("pause_ended" if event_type == "pause_end" else "pause_started", [racer["id"]])
+        # the client reloads the board after replaying its queue
+        self.refresh()
+
+
+# -----------------------
+# Database metrics
+# -----------------------
+class DbMetrics:
+    """Query counts from pg_stat_statements and CPU samples from ``docker stats``."""
+
+    def __init__(self, args) -> None:
+        self.args = args
+        self.conn = None
+        self.cpu_samples: List[float] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_calls: Optional[int] = None
+        self.query_count: Optional[int] = None
+        self.container = args.db_container or self._compose_container()
+
+    def _compose_container(self) -> Optional[str]:
+        try:
+            output = subprocess.run(
+                ["docker", "compose", "ps", "-q", "db"], capture_output=True, text=True, timeout=10, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            return None
+        return output or None
+
+    def _statement_calls(self) -> Optional[int]:
+        if self.conn is None:
+            return None
+        with self.conn.cursor() as cr:
+            cr.execute(
+                """
+                SELECT COALESCE(SUM(calls), 0) FROM pg_stat_statements
+                 WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+                """
+            )
+            return int(cr.fetchone()[0])
+
+    def start(self) -> None:
+        try:
+            import psycopg2
+            self.conn = psycopg2.connect(self.args.pg_dsn or f"host=localhost port=5432 dbname={self.args.db} user=odoo password=odoo")
+            self.conn.autocommit = True
+            with self.conn.cursor() as cr:
+                cr.execute("CREATE EXTENSION IF NOT EXISTS pg_stat_statements")
+            self._start_calls = self._statement_calls()
+        except Exception as exc:  # missing driver, no access, extension not preloaded
+            print(f"pg_stat_statements unavailable: {exc}", file=sys.stderr)
+            self.conn = None
+        if self.container:
+            self._thread = threading.Thread(target=self._sample_cpu, daemon=True)
+            self._thread.start()
+
+    def _sample_cpu(self) -> None:
+        while not self._stop.is_set():
+            try:
+                output = subprocess.run(
+                    ["docker", "stats", "--no-stream", "--format", "{{.CPUPerc}}", self.container],
+                    capture_output=True, text=True, timeout=15, check=True,
+                ).stdout.strip()
+                self.cpu_samples.append(float(output.rstrip("%")))
+            except (OSError, subprocess.SubprocessError, ValueError):
+                return
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=20)
+        if self.conn is not None and self._start_calls is not None:
+            self.query_count = self._statement_calls() - self._start_calls
+            self.conn.close()
+
+
+# -----------------------
+# Runner
+# -----------------------
+def build_stations(args, stats: Stats, stop: threading.Event) -> List[Station]:
+    def session() -> Session:
+        return Session(args.url, args.db, args.login, args.password, args.timeout)
+
+    bus = RaceBus()
+
+    stations: List[Station] = []
+    for index in range(args.desks):
+        stations.append(RegistrationDesk(f"desk{index}", session(), stats, stop, args, bus))
+    for index in range(args.start):
+        stations.append(StartScreen(f"start{index}", session(), stats, stop, args, bus))
+    for index in range(args.finish):
+        stations.append(FinishScreen(f"finish{index}", session(), stats, stop, args, bus))
+    if args.pause:
+        checkpoints = session().call("salezrace.checkpoint", "search_read", [], fields=["id"], order="sequence")
+        if not checkpoints:
+            raise SystemExit("Pause screens need at least one salezrace.checkpoint.")
+        for index in range(args.pause):
+            checkpoint_id = checkpoints[index % len(checkpoints)]["id"]
+            stations.append(PauseScreen(f"pause{index}", session(), stats, stop, args, bus, checkpoint_id=checkpoint_id))
+    return stations
+
+
+def report(stats: Stats, metrics: DbMetrics, elapsed: float) -> Dict[str, Any]:
+    calls = {}
+    for name, samples in sorted(stats.latencies.items()):
+        calls[name] = {
+            "count": len(samples),
+            "errors": stats.errors[name],
+            "failures": stats.failures[name],
+            "p50_ms": percentile(samples, 50) * 1000,
+            "p95_ms": percentile(samples, 95) * 1000,
+            "p99_ms": percentile(samples, 99) * 1000,
+        }
+    requests = stats.request_count
+    return {
+        "elapsed_s": elapsed,
+        "requests": requests,
+        "requests_per_s": requests / elapsed if elapsed else 0,
+        "queries_per_request": metrics.query_count / requests if metrics.query_count is not None and requests else None,
+        "db_cpu_avg_pct": sum(metrics.cpu_samples) / len(metrics.cpu_samples) if metrics.cpu_samples else None,
+        "db_cpu_max_pct": max(metrics.cpu_samples) if metrics.cpu_samples else None,
+        "calls": calls,
+    }
+
+
+def print_report(result: Dict[str, Any]) -> None:
+    def fmt(value: Optional[float], unit: str = "") -> str:
+        return "n/a" if value is None else f"{value:.1f}{unit}"
+
+    print(f"\n{result['requests']} requests in {result['elapsed_s']:.0f}s ({result['requests_per_s']:.1f}/s)")
+    print(f"queries/request: {fmt(result['queries_per_request'])}   "
+          f"DB CPU avg/max: {fmt(result['db_cpu_avg_pct'], '%')} / {fmt(result['db_cpu_max_pct'], '%')}\n")
+    print(f"{'call':<52}{'count':>7}{'err':>6}{'fail':>6}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for name, row in result["calls"].items():
+        print(f"{name:<52}{row['count']:>7}{row['errors']:>6}{row['failures']:>6}"
+              f"{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['p99_ms']:>9.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default="http://localhost:8069")
+    parser.add_argument("--db", required=True)
+    parser.add_argument("--login", default="admin")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--desks", type=int, default=2, help="registration desks")
+    parser.add_argument("--start", type=int, default=1, help="Start screens")
+    parser.add_argument("--finish", type=int, default=1, help="Finish screens")
+    parser.add_argument("--pause", type=int, default=4, help="Pause screens (spread over the checkpoints)")
+    parser.add_argument("--duration", type=float, default=60, help="seconds")
+    parser.add_argument("--action-interval", type=float, default=3.0, help="mean seconds between a station's actions")
+    parser.add_argument("--bus-down", action="store_true",
+                        help=f"simulate a disconnected bus: screens refresh every {FALLBACK_POLL:.0f} s instead")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout in seconds")
+    parser.add_argument("--pg-dsn", help="libpq DSN of the Odoo database (default: docker-compose db)")
+    parser.add_argument("--db-container", help="Postgres container for CPU sampling (default: compose service 'db')")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    stats = Stats()
+    stop = threading.Event()
+    stations = build_stations(args, stats, stop)
+    metrics = DbMetrics(args)
+    metrics.start()
+
+    started = time.monotonic()
+    for station in stations:
+        station.start()
+    try:
+        stop.wait(args.duration)
+    except KeyboardInterrupt:
+        pass
+    stop.set()
+    for station in stations:
+        station.join(timeout=args.timeout)
+    elapsed = time.monotonic() - started
+    metrics.stop()
+
+    result = report(stats, metrics, elapsed)
+    print_report(result)
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump(result, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Compare OdooClient's XML-RPC and JSON-RPC backends on large reads.
+
+Measures wall time, rows per second, bytes on the wire and peak Python
+memory (tracemalloc) of ``OdooClient.search_read`` for each protocol.
+
+By default it runs against a local stand-in server that answers with a
+pre-encoded result of ``--rows`` synthetic rows, so only the client side
+(transport, parsing, memory) is measured:
+
+    python benchmarks/rpc_protocols.py --rows 100000
+
+Pass ``--url``/``--db``/``--login``/``--password`` to read ``--model`` from a
+real Odoo instead (server-side serialization is then included).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+import xmlrpc.client
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from odoo_client import OdooClient, OdooConfig  # noqa: E402
+
+PROTOCOLS = ("xmlrpc", "jsonrpc")
+
+
+def synthetic_rows(count: int) -> List[Dict[str, Any]]:
+    """Rows shaped like a racer search_read (ints, strings, many2one pairs, falsy values)."""
+    return [
+        {
+            "id": index,
+            "racer_no": index,
+            "first_name": f"First{index}",
+            "last_name": f"Last{index}",
+            "age": 6 + index % 60,
+            "gender": "male" if index % 2 else "female",
+            "category": f"M{index % 7}",
+            "start_time": "2026-05-01 09:00:00",
+            "finish_time": "2026-05-01 09:42:17" if index % 3 else False,
+            "final_time": "42:17" if index % 3 else False,
+            "create_uid": [2, "Administrator"],
+        }
+        for index in range(1, count + 1)
+    ]
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers authenticate with uid 2 and every execute_kw with the canned rows."""
+
+    protocol_version = "HTTP/1.1"
+    responses_by_path: Dict[str, Dict[str, bytes]] = {}
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path == "/jsonrpc":
+            method = json.loads(body)["params"]["method"]
+        else:
+            method = xmlrpc.client.loads(body)[1]
+        payload = self.responses_by_path[self.path][method]
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def start_stand_in(rows: List[Dict[str, Any]]) -> ThreadingHTTPServer:
+    def xml(result: Any) -> bytes:
+        return xmlrpc.client.dumps((result,), methodresponse=True, allow_none=True).encode()
+
+    def jsn(result: Any) -> bytes:
+        return json.dumps({"jsonrpc": "2.0", "id": 1, "result": result}).encode()
+
+    StandInHandler.responses_by_path = {
+        "/xmlrpc/2/common": {"authenticate": xml(2)},
+        "/xmlrpc/2/object": {"execute_kw": xml(rows)},
+        "/jsonrpc": {"authenticate": jsn(2), "execute_kw": jsn(rows)},
+    }
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(config: OdooConfig, model: str, fields: Optional[List[str]], limit: int, repeat: int) -> Dict[str, Any]:
+    client = OdooClient(config)
+    client.authenticate()
+    timings = []
+    rows = 0
+    for _attempt in range(repeat):
+        started = time.perf_counter()
+        rows = len(client.search_read(model, [], fields=fields, limit=limit))
+        timings.append(time.perf_counter() - started)
+
+    # Separate run for memory: tracemalloc itself slows allocation down
+    tracemalloc.start()
+    client.search_read(model, [], fields=fields, limit=limit)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    client.close()
+
+    best = min(timings)
+    return {
+        "protocol": config.protocol,
+        "rows": rows,
+        "best_s": best,
+        "median_s": statistics.median(timings),
+        "rows_per_s": rows / best if best else 0,
+        "peak_mib": peak / 2 ** 20,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100000, help="rows per read")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--url", help="real Odoo URL (default: local stand-in server)")
+    parser.add_argument("--db", default="bench")
+    parser.add_argument("--login", default="admin")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--model", default="salezrace.racer")
+    parser.add_argument("--fields", nargs="*", help="fields to read (default: all)")
+    args = parser.parse_args()
+
+    url = args.url
+    if not url:
+        rows = synthetic_rows(args.rows)
+        server = start_stand_in(rows)
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        for path, payloads in StandInHandler.responses_by_path.items():
+            if "execute_kw" in payloads:
+                print(f"{path}: {len(payloads['execute_kw']) / 2 ** 20:.1f} MiB response")
+        del rows
+
+    print(f"{'protocol':<10}{'rows':>9}{'best s':>9}{'median s':>10}{'rows/s':>11}{'peak MiB':>10}")
+    for protocol in PROTOCOLS:
+        config = OdooConfig(
+            url=url, database=args.db, username=args.login, password=args.password, protocol=protocol, timeout=600,
+        )
+        result = run(config, args.model, args.fields, args.rows, args.repeat)
+        print(f"{result['protocol']:<10}{result['rows']:>9}{result['best_s']:>9.2f}{result['median_s']:>10.2f}"
+              f"{result['rows_per_s']:>11.0f}{result['peak_mib']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,19 @@
 """Odoo XML-RPC client for API communication."""
 
+import asyncio
+import http.client
+import itertools
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
 import xmlrpc.client
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urljoin
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Optional, Union
+from urllib.parse import urljoin, urlsplit
 
 from pydantic import BaseModel, Field, ValidationError
 
@@ -16,6 +27,17 @@ class OdooConfig(BaseModel):
     password: Optional[str] = Field(None, description="Odoo password")
     api_key: Optional[str] = Field(None, description="Odoo API key")
     timeout: int = Field(120, description="Request timeout in seconds")
+    pool_size: int = Field(4, ge=1, description="Maximum number of pooled keep-alive connections")
+    protocol: Literal["xmlrpc", "jsonrpc"] = Field(
+        "xmlrpc", description="RPC protocol: XML-RPC (/xmlrpc/2) or JSON-RPC (/jsonrpc)"
+    )
+    metadata_cache_ttl: int = Field(
+        3600, ge=0, description="Seconds to cache fields_get/get_model_list results (0 disables)"
+    )
+    metadata_cache_size: int = Field(256, ge=1, description="Maximum number of cached metadata entries")
+    metadata_cache_path: Optional[str] = Field(
+        None, description="JSON file persisting the metadata cache across restarts"
+    )
 
     def model_post_init(self, __context: Any) -> None:
         """Validate that either password or api_key is provided."""
@@ -23,8 +45,263 @@ class OdooConfig(BaseModel):
             raise ValueError("Either password or api_key must be provided")
 
 
+class PooledTransport(xmlrpc.client.Transport):
+    """Thread-safe XML-RPC transport over a bounded pool of keep-alive connections.
+
+    Each request checks out its own HTTP/1.1 connection, so concurrent calls
+    never share a socket, and returns it to the pool once the response is
+    fully read. At most ``pool_size`` requests are in flight; further callers
+    wait for a free connection.
+    """
+
+    content_type = "text/xml"
+
+    def __init__(self, use_https: bool, timeout: float, pool_size: int) -> None:
+        super().__init__(use_builtin_types=True)
+        self.use_https = use_https
+        self.timeout = timeout
+        self.verbose = False
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+
+    def make_connection(self, host: Any) -> http.client.HTTPConnection:
+        """Open a new connection (never cached on the transport itself)."""
+        chost, self._extra_headers, x509 = self.get_host_info(host)
+        if self.use_https:
+            return http.client.HTTPSConnection(chost, timeout=self.timeout, **(x509 or {}))
+        return http.client.HTTPConnection(chost, timeout=self.timeout)
+
+    def request(self, host: Any, handler: str, request_body: bytes, verbose: bool = False) -> Any:
+        with self._slots:
+            try:
+                connection, reused = self._idle.get_nowait(), True
+            except queue.Empty:
+                connection, reused = self.make_connection(host), False
+            try:
+                return self._single_request(connection, host, handler, request_body)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+                # The server closed an idle keep-alive connection: retry once on a new one.
+                return self._single_request(self.make_connection(host), host, handler, request_body)
+
+    def _single_request(
+        self,
+        connection: http.client.HTTPConnection,
+        host: Any,
+        handler: str,
+        request_body: bytes,
+    ) -> Any:
+        try:
+            connection.putrequest("POST", handler, skip_accept_encoding=True)
+            _chost, extra_headers, _x509 = self.get_host_info(host)
+            headers = list(self._headers) + list(extra_headers or []) + [
+                ("Content-Type", self.content_type),
+                ("User-Agent", self.user_agent),
+            ]
+            self.send_headers(connection, headers)
+            self.send_content(connection, request_body)
+            response = connection.getresponse()
+            if response.status != 200:
+                response.read()
+                raise xmlrpc.client.ProtocolError(
+                    host + handler, response.status, response.reason, dict(response.getheaders())
+                )
+            result = self.parse_response(response)
+        except BaseException:
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            self._idle.put(connection)
+        return result
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class MetadataCache:
+    """Thread-safe TTL + LRU cache for model metadata (fields_get, model list).
+
+    Keys are ``(method, database, model, fields, attributes)`` tuples. With a ``path``
+    the entries are loaded on start and written back at most every
+    ``SAVE_DELAY`` seconds by a background timer (and on ``flush``), so a
+    restarted server answers from disk until the entries expire. Callers,
+    including the event loop of the async client, never wait for the file.
+    """
+
+    # Seconds changes are batched before the file is rewritten
+    SAVE_DELAY = 1.0
+
+    def __init__(self, ttl: int, max_size: int, path: Optional[str] = None) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.path = path
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Serializes file writes so an older snapshot never replaces a newer one
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        if path:
+            self._load()
+
+    @staticmethod
+    def key(method: str, database: str, model: str, fields: Optional[List[str]] = None,
+            attributes: Optional[List[str]] = None) -> tuple:
+        """Cache key; field and attribute lists are order-insensitive."""
+        return (
+            method,
+            database,
+            model,
+            tuple(sorted(fields)) if fields is not None else None,
+            tuple(sorted(attributes)) if attributes is not None else None,
+        )
+
+    def get(self, key: tuple) -> Any:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple, value: Any) -> None:
+        if not self.ttl:
+            return
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            self._schedule_save()
+
+    def invalidate(self, database: Optional[str] = None, model: Optional[str] = None) -> None:
+        """Drop the entries of ``model`` (and/or ``database``), or everything."""
+        with self._lock:
+            for key in list(self._entries):
+                if (database is None or key[1] == database) and (model is None or key[2] == model):
+                    del self._entries[key]
+            self._schedule_save()
+
+    def flush(self) -> None:
+        """Write pending changes to the file now (e.g. on shutdown)."""
+        with self._lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer is not None:
+            timer.cancel()
+            self._save()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path) as handle:
+                entries = json.load(handle)
+            now = time.time()
+            loaded = OrderedDict()
+            for (method, database, model, fields, attributes), expires_at, value in entries:
+                if expires_at > now:
+                    key = (method, database, model, tuple(fields) if fields is not None else None,
+                           tuple(attributes) if attributes is not None else None)
+                    loaded[key] = (expires_at, value)
+        except (OSError, TypeError, ValueError):
+            # Missing, unreadable or malformed file: start empty
+            return
+        # The file may hold more entries than this cache's limit: keep the most recent ones
+        while len(loaded) > self.max_size:
+            loaded.popitem(last=False)
+        self._entries = loaded
+
+    def _schedule_save(self) -> None:
+        """Arm the save timer unless one is pending; call with ``_lock`` held."""
+        if not self.path or self._save_timer is not None:
+            return
+        self._save_timer = threading.Timer(self.SAVE_DELAY, self._save_scheduled)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def _save_scheduled(self) -> None:
+        with self._lock:
+            if self._save_timer is None:
+                return  # flushed meanwhile
+            self._save_timer = None
+        self._save()
+
+    def _save(self) -> None:
+        with self._save_lock:
+            with self._lock:
+                entries = [[list(key), expires_at, value] for key, (expires_at, value) in self._entries.items()]
+            directory = os.path.dirname(os.path.abspath(self.path))
+            # Write-and-rename so a crash never leaves a truncated file behind
+            with tempfile.NamedTemporaryFile("w", dir=directory, delete=False) as handle:
+                json.dump(entries, handle, default=str)
+            os.replace(handle.name, self.path)
+
+
+def jsonrpc_request(service: str, method: str, args: Any, request_id: int) -> bytes:
+    """Encode a call of ``service.method(*args)`` for Odoo's ``/jsonrpc`` endpoint."""
+    return json.dumps({
+        "jsonrpc": "2.0",
+        "method": "call",
+        "id": request_id,
+        "params": {"service": service, "method": method, "args": list(args)},
+    }).encode()
+
+
+def jsonrpc_result(body: bytes) -> Any:
+    """Decode a ``/jsonrpc`` response body, raising server errors."""
+    payload = json.loads(body)
+    error = payload.get("error")
+    if error:
+        # Same exception as the XML-RPC backend raises for server errors
+        data = error.get("data") or {}
+        raise xmlrpc.client.Fault(error.get("code", 1), data.get("debug") or data.get("message") or error.get("message"))
+    return payload.get("result")
+
+
+class JsonRpcTransport(PooledTransport):
+    """Pooled transport for Odoo's ``/jsonrpc`` endpoint."""
+
+    content_type = "application/json"
+
+    def parse_response(self, response: http.client.HTTPResponse) -> Any:
+        return jsonrpc_result(response.read())
+
+
+class JsonRpcServerProxy:
+    """``xmlrpc.client.ServerProxy`` look-alike for one service of ``/jsonrpc``.
+
+    ``proxy.method(*args)`` calls ``method`` of the service (``common`` or
+    ``object``), so OdooClient uses both backends the same way.
+    """
+
+    def __init__(self, url: str, service: str, transport: JsonRpcTransport) -> None:
+        parts = urlsplit(url)
+        self._host = parts.netloc
+        self._handler = parts.path
+        self._service = service
+        self._transport = transport
+        self._ids = itertools.count(1)
+
+    def __getattr__(self, method: str) -> Any:
+        def call(*args: Any) -> Any:
+            body = jsonrpc_request(self._service, method, args, next(self._ids))
+            return self._transport.request(self._host, self._handler, body)
+
+        return call
+
+
 class OdooClient:
-    """Client for interacting with Odoo via XML-RPC."""
+    """Client for interacting with Odoo via XML-RPC or JSON-RPC."""
 
     def __init__(self, config: OdooConfig) -> None:
         """Initialize Odoo client with configuration."""
@@ -34,19 +311,42 @@ class OdooClient:
         self.username = config.username
         self.password = config.api_key or config.password
         self.uid: Optional[int] = None
-        
-        # Initialize XML-RPC endpoints
-        self.common = xmlrpc.client.ServerProxy(
-            urljoin(self.url, "/xmlrpc/2/common"),
-            allow_none=True,
-            use_builtin_types=True,
+        self.metadata_cache = MetadataCache(
+            config.metadata_cache_ttl, config.metadata_cache_size, config.metadata_cache_path
         )
-        self.models = xmlrpc.client.ServerProxy(
-            urljoin(self.url, "/xmlrpc/2/object"),
-            allow_none=True,
-            use_builtin_types=True,
+
+        # Both endpoints share one pool of keep-alive connections
+        transport_class = JsonRpcTransport if config.protocol == "jsonrpc" else PooledTransport
+        self.transport = transport_class(
+            use_https=urlsplit(self.url).scheme == "https",
+            timeout=config.timeout,
+            pool_size=config.pool_size,
         )
 
+        # Initialize RPC endpoints
+        if config.protocol == "jsonrpc":
+            endpoint = urljoin(self.url, "/jsonrpc")
+            self.common = JsonRpcServerProxy(endpoint, "common", self.transport)
+            self.models = JsonRpcServerProxy(endpoint, "object", self.transport)
+        else:
+            self.common = xmlrpc.client.ServerProxy(
+                urljoin(self.url, "/xmlrpc/2/common"),
+                transport=self.transport,
+                allow_none=True,
+                use_builtin_types=True,
+            )
+            self.models = xmlrpc.client.ServerProxy(
+                urljoin(self.url, "/xmlrpc/2/object"),
+                transport=self.transport,
+                allow_none=True,
+                use_builtin_types=True,
+            )
+
+    def close(self) -> None:
+        """Close the pooled connections and write pending cache changes."""
+        self.transport.close()
+        self.metadata_cache.flush()
+
     def authenticate(self) -> int:
         """Authenticate with Odoo and return user ID."""
         if self.uid is None:
@@ -118,6 +418,52 @@ class OdooClient:
             
         return self.execute(model, "search_read", domain, **kwargs)
 
+    def search_read_page(
+        self,
+        model: str,
+        domain: Optional[List[List[Any]]] = None,
+        fields: Optional[List[str]] = None,
+        after_id: int = 0,
+        page_size: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        """Read one keyset page: up to page_size records with id > after_id, in id order."""
+        domain = [["id", ">", after_id]] + list(domain or []) if after_id else domain
+        return self.search_read(model, domain, fields, limit=page_size, order="id")
+
+    def iter_search_read(
+        self,
+        model: str,
+        domain: Optional[List[List[Any]]] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 1000,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield all matching records in id order, reading them page by page.
+
+        Pages are id ranges (keyset pagination), so late pages cost as much as
+        the first one and neither side holds the whole result. With prefetch
+        the next page is requested on another pooled connection while the
+        current one is consumed.
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page = self.search_read_page(model, domain, fields, 0, page_size)
+            while page:
+                last_id = page[-1]["id"]
+                has_more = len(page) == page_size
+                if has_more and executor:
+                    next_page = executor.submit(self.search_read_page, model, domain, fields, last_id, page_size)
+                yield from page
+                if not has_more:
+                    return
+                if executor:
+                    page = next_page.result()
+                else:
+                    page = self.search_read_page(model, domain, fields, last_id, page_size)
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
     def read(
         self,
         model: str,
@@ -184,8 +530,288 @@ class OdooClient:
         if attributes is not None:
             kwargs["attributes"] = attributes
             
-        return self.execute(model, "fields_get", **kwargs)
+        key = MetadataCache.key("fields_get", self.database, model, fields, attributes)
+        result = self.metadata_cache.get(key)
+        if result is None:
+            result = self.execute(model, "fields_get", **kwargs)
+            self.metadata_cache.put(key, result)
+        return result
 
     def get_model_list(self) -> List[Dict[str, Any]]:
         """Get list of all available models."""
-        return self.search_read("ir.model", [], ["model", "name", "transient"])
\ No newline at end of file
+        key = MetadataCache.key("get_model_list", self.database, "ir.model")
+        result = self.metadata_cache.get(key)
+        if result is None:
+            result = self.search_read("ir.model", [], ["model", "name", "transient"])
+            self.metadata_cache.put(key, result)
+        return result
+
+    def invalidate_metadata(self, model: Optional[str] = None) -> None:
+        """Forget cached metadata of model (all models if None), e.g. after a module upgrade."""
+        self.metadata_cache.invalidate(self.database, model)
+
+
+# Response bodies smaller than this are decoded on the event loop; larger ones in a thread
+ASYNC_DECODE_INLINE_SIZE = 64 * 1024
+
+
+class AsyncOdooClient:
+    """asyncio client with the same API as OdooClient.
+
+    Calls go through one ``httpx.AsyncClient`` whose keep-alive pool holds
+    ``pool_size`` connections; at most ``pool_size`` calls are in flight and
+    the others wait as coroutines, not threads.
+    """
+
+    def __init__(self, config: OdooConfig) -> None:
+        """Initialize the async Odoo client with configuration."""
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("AsyncOdooClient requires the httpx package.") from None
+
+        self.config = config
+        self.url = config.url.rstrip("/")
+        self.database = config.database
+        self.username = config.username
+        self.password = config.api_key or config.password
+        self.uid: Optional[int] = None
+        self.metadata_cache = MetadataCache(
+            config.metadata_cache_ttl, config.metadata_cache_size, config.metadata_cache_path
+        )
+
+        self.http = httpx.AsyncClient(
+            timeout=config.timeout,
+            limits=httpx.Limits(max_connections=config.pool_size, max_keepalive_connections=config.pool_size),
+        )
+        self._slots = asyncio.Semaphore(config.pool_size)
+        self._auth_lock = asyncio.Lock()
+        self._ids = itertools.count(1)
+
+    async def close(self) -> None:
+        """Close the pooled connections and write pending cache changes."""
+        await self.http.aclose()
+        await asyncio.to_thread(self.metadata_cache.flush)
+
+    async def _call(self, service: str, method: str, *args: Any) -> Any:
+        """Call ``service.method(*args)`` over the configured protocol."""
+        if self.config.protocol == "jsonrpc":
+            endpoint = urljoin(self.url, "/jsonrpc")
+            body = jsonrpc_request(service, method, args, next(self._ids))
+            content_type = "application/json"
+        else:
+            endpoint = urljoin(self.url, f"/xmlrpc/2/{service}")
+            body = xmlrpc.client.dumps(args, method, allow_none=True).encode()
+            content_type = "text/xml"
+
+        async with self._slots:
+            response = await self.http.post(endpoint, content=body, headers={"Content-Type": content_type})
+        if response.status_code != 200:
+            raise xmlrpc.client.ProtocolError(
+                endpoint, response.status_code, response.reason_phrase, dict(response.headers)
+            )
+        if len(response.content) < ASYNC_DECODE_INLINE_SIZE:
+            return self._decode(response.content)
+        # Decoding a large result takes seconds; keep the event loop serving other calls
+        return await asyncio.to_thread(self._decode, response.content)
+
+    def _decode(self, content: bytes) -> Any:
+        """Decode a response body of the configured protocol."""
+        if self.config.protocol == "jsonrpc":
+            return jsonrpc_result(content)
+        return xmlrpc.client.loads(content, use_builtin_types=True)[0][0]
+
+    async def authenticate(self) -> int:
+        """Authenticate with Odoo and return user ID."""
+        async with self._auth_lock:
+            if self.uid is None:
+                uid = await self._call("common", "authenticate", self.database, self.username, self.password, {})
+                if not uid:
+                    raise ValueError("Authentication failed. Check your credentials.")
+                self.uid = uid
+        return self.uid
+
+    async def execute(
+        self,
+        model: str,
+        method: str,
+        *args: Any,
+        **kwargs: Any
+    ) -> Any:
+        """Execute a method on an Odoo model."""
+        uid = await self.authenticate()
+        return await self._call(
+            "object", "execute_kw", self.database, uid, self.password, model, method, args, kwargs
+        )
+
+    async def search(
+        self,
+        model: str,
+        domain: Optional[List[List[Any]]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+    ) -> List[int]:
+        """Search for record IDs matching the domain."""
+        domain = domain or []
+        kwargs: Dict[str, Any] = {"offset": offset}
+        if limit is not None:
+            kwargs["limit"] = limit
+        if order is not None:
+            kwargs["order"] = order
+
+        return await self.execute(model, "search", domain, **kwargs)
+
+    async def search_read(
+        self,
+        model: str,
+        domain: Optional[List[List[Any]]] = None,
+        fields: Optional[List[str]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Search and read records in a single call."""
+        domain = domain or []
+        kwargs: Dict[str, Any] = {"offset": offset}
+        if fields is not None:
+            kwargs["fields"] = fields
+        if limit is not None:
+            kwargs["limit"] = limit
+        if order is not None:
+            kwargs["order"] = order
+
+        return await self.execute(model, "search_read", domain, **kwargs)
+
+    async def search_read_page(
+        self,
+        model: str,
+        domain: Optional[List[List[Any]]] = None,
+        fields: Optional[List[str]] = None,
+        after_id: int = 0,
+        page_size: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        """Read one keyset page: up to page_size records with id > after_id, in id order."""
+        domain = [["id", ">", after_id]] + list(domain or []) if after_id else domain
+        return await self.search_read(model, domain, fields, limit=page_size, order="id")
+
+    async def iter_search_read(
+        self,
+        model: str,
+        domain: Optional[List[List[Any]]] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 1000,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield all matching records in id order, reading them page by page.
+
+        See OdooClient.iter_search_read; with prefetch the next page is
+        requested in a task while the current one is consumed.
+        """
+        next_page: Optional[asyncio.Task] = None
+        try:
+            page = await self.search_read_page(model, domain, fields, 0, page_size)
+            while page:
+                last_id = page[-1]["id"]
+                has_more = len(page) == page_size
+                if has_more and prefetch:
+                    next_page = asyncio.create_task(
+                        self.search_read_page(model, domain, fields, last_id, page_size)
+                    )
+                for record in page:
+                    yield record
+                if not has_more:
+                    return
+                if next_page:
+                    page, next_page = await next_page, None
+                else:
+                    page = await self.search_read_page(model, domain, fields, last_id, page_size)
+        finally:
+            if next_page:
+                next_page.cancel()
+
+    async def read(
+        self,
+        model: str,
+        ids: Union[int, List[int]],
+        fields: Optional[List[str]] = None,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Read records by IDs."""
+        if isinstance(ids, int):
+            ids = [ids]
+
+        kwargs: Dict[str, Any] = {}
+        if fields is not None:
+            kwargs["fields"] = fields
+
+        result = await self.execute(model, "read", ids, **kwargs)
+        return result[0] if len(ids) == 1 else result
+
+    async def create(
+        self,
+        model: str,
+        values: Union[Dict[str, Any], List[Dict[str, Any]]],
+    ) -> Union[int, List[int]]:
+        """Create one or more records."""
+        single_record = isinstance(values, dict)
+        if single_record:
+            values = [values]
+
+        result = await self.execute(model, "create", values)
+        return result[0] if single_record else result
+
+    async def write(
+        self,
+        model: str,
+        ids: Union[int, List[int]],
+        values: Dict[str, Any],
+    ) -> bool:
+        """Update records."""
+        if isinstance(ids, int):
+            ids = [ids]
+
+        return await self.execute(model, "write", ids, values)
+
+    async def unlink(
+        self,
+        model: str,
+        ids: Union[int, List[int]],
+    ) -> bool:
+        """Delete records."""
+        if isinstance(ids, int):
+            ids = [ids]
+
+        return await self.execute(model, "unlink", ids)
+
+    async def fields_get(
+        self,
+        model: str,
+        fields: Optional[List[str]] = None,
+        attributes: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get field definitions for a model."""
+        kwargs: Dict[str, Any] = {}
+        if fields is not None:
+            kwargs["allfields"] = fields
+        if attributes is not None:
+            kwargs["attributes"] = attributes
+
+        key = MetadataCache.key("fields_get", self.database, model, fields, attributes)
+        result = self.metadata_cache.get(key)
+        if result is None:
+            result = await self.execute(model, "fields_get", **kwargs)
+            self.metadata_cache.put(key, result)
+        return result
+
+    async def get_model_list(self) -> List[Dict[str, Any]]:
+        """Get list of all available models."""
+        key = MetadataCache.key("get_model_list", self.database, "ir.model")
+        result = self.metadata_cache.get(key)
+        if result is None:
+            result = await self.search_read("ir.model", [], ["model", "name", "transient"])
+            self.metadata_cache.put(key, result)
+        return result
+
+    def invalidate_metadata(self, model: Optional[str] = None) -> None:
+        """Forget cached metadata of model (all models if None), e.g. after a module upgrade."""
+        self.metadata_cache.invalidate(self.database, model)
@@ -10,7 +10,7 @@ from mcp.server import Server
 from mcp.types import TextContent, Tool
 from pydantic import ValidationError
 
-from odoo_client import OdooClient, OdooConfig
+from odoo_client import AsyncOdooClient, OdooConfig
 
 # Load environment variables
 load_dotenv()
@@ -18,11 +18,14 @@ load_dotenv()
 # Initialize MCP server
 server = Server("odoo-mcp-server")
 
+# Largest page search_records returns in page mode; bigger page_size values are clamped
+MAX_PAGE_SIZE = 2000
+
 # Global Odoo client instance
-odoo_client: Optional[OdooClient] = None
+odoo_client: Optional[AsyncOdooClient] = None
 
 
-def get_odoo_client() -> OdooClient:
+def get_odoo_client() -> AsyncOdooClient:
     """Get or create Odoo client instance."""
     global odoo_client
     
@@ -35,8 +38,12 @@ def get_odoo_client() -> OdooClient:
                 password=os.environ.get("ODOO_PASSWORD"),
                 api_key=os.environ.get("ODOO_API_KEY"),
                 timeout=int(os.environ.get("ODOO_TIMEOUT", "120")),
+                pool_size=int(os.environ.get("ODOO_POOL_SIZE", "4")),
+                protocol=os.environ.get("ODOO_PROTOCOL", "xmlrpc"),
+                metadata_cache_ttl=int(os.environ.get("ODOO_METADATA_CACHE_TTL", "3600")),
+                metadata_cache_path=os.environ.get("ODOO_METADATA_CACHE_PATH"),
             )
-            odoo_client = OdooClient(config)
+            odoo_client = AsyncOdooClient(config)
         except (KeyError, ValidationError) as e:
             raise ValueError(f"Invalid Odoo configuration: {e}")
     
@@ -84,6 +91,22 @@ async def list_tools() -> List[Tool]:
                         "description": "Sort order (e.g., 'name asc, id desc')",
                         "default": None,
                     },
+                    "page_size": {
+                        "type": "integer",
+                        "description": (
+                            "Return one page of at most this many records in id order, with a "
+                            "next_cursor to fetch the following page (limit, offset and order are ignored). "
+                            f"Capped at {MAX_PAGE_SIZE}."
+                        ),
+                        "minimum": 1,
+                        "maximum": MAX_PAGE_SIZE,
+                        "default": None,
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor returned by the previous page",
+                        "default": None,
+                    },
                 },
                 "required": ["model"],
             },
@@ -184,6 +207,11 @@ async def list_tools() -> List[Tool]:
                         "description": "Include transient (wizard) models",
                         "default": False,
                     },
+                    "refresh": {
+                        "type": "boolean",
+                        "description": "Bypass the metadata cache (e.g. after a module upgrade)",
+                        "default": False,
+                    },
                 },
             },
         ),
@@ -203,6 +231,11 @@ async def list_tools() -> List[Tool]:
                         "items": {"type": "string"},
                         "default": None,
                     },
+                    "refresh": {
+                        "type": "boolean",
+                        "description": "Bypass the metadata cache (e.g. after a module upgrade)",
+                        "default": False,
+                    },
                 },
                 "required": ["model"],
             },
@@ -216,9 +249,23 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     try:
         client = get_odoo_client()
         
-        if name == "search_records":
-            result = await asyncio.to_thread(
-                client.search_read,
+        if name == "search_records" and arguments.get("page_size"):
+            page_size = max(1, min(int(arguments["page_size"]), MAX_PAGE_SIZE))
+            records = await client.search_read_page(
+                model=arguments["model"],
+                domain=arguments.get("domain", []),
+                fields=arguments.get("fields"),
+                after_id=int(arguments.get("cursor") or 0),
+                page_size=page_size,
+            )
+            next_cursor = str(records[-1]["id"]) if len(records) == page_size else None
+            return [TextContent(
+                type="text",
+                text=json.dumps({"records": records, "next_cursor": next_cursor}, indent=2, default=str)
+            )]
+
+        elif name == "search_records":
+            result = await client.search_read(
                 model=arguments["model"],
                 domain=arguments.get("domain", []),
                 fields=arguments.get("fields"),
@@ -232,8 +279,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             )]
             
         elif name == "create_record":
-            result = await asyncio.to_thread(
-                client.create,
+            result = await client.create(
                 model=arguments["model"],
                 values=arguments["values"],
             )
@@ -243,8 +289,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             )]
             
         elif name == "update_record":
-            success = await asyncio.to_thread(
-                client.write,
+            success = await client.write(
                 model=arguments["model"],
                 ids=arguments["ids"],
                 values=arguments["values"],
@@ -255,8 +300,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             )]
             
         elif name == "delete_record":
-            success = await asyncio.to_thread(
-                client.unlink,
+            success = await client.unlink(
                 model=arguments["model"],
                 ids=arguments["ids"],
             )
@@ -266,8 +310,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             )]
             
         elif name == "get_record":
-            result = await asyncio.to_thread(
-                client.read,
+            result = await client.read(
                 model=arguments["model"],
                 ids=arguments["ids"],
                 fields=arguments.get("fields"),
@@ -278,7 +321,9 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             )]
             
         elif name == "list_models":
-            models = await asyncio.to_thread(client.get_model_list)
+            if arguments.get("refresh"):
+                client.invalidate_metadata("ir.model")
+            models = await client.get_model_list()
             if not arguments.get("transient", False):
                 models = [m for m in models if not m.get("transient", False)]
             
@@ -290,8 +335,9 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             return [TextContent(type="text", text=output)]
             
         elif name == "get_model_fields":
-            fields = await asyncio.to_thread(
-                client.fields_get,
+            if arguments.get("refresh"):
+                client.invalidate_metadata(arguments["model"])
+            fields = await client.fields_get(
                 model=arguments["model"],
                 fields=arguments.get("fields"),
             )